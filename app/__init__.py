@@ -6,6 +6,7 @@ This package provides hierarchical marketing agents with LLM-based routing,
 tool integration, and comprehensive monitoring.
 """
 
+import logging
 import os
 from dotenv import load_dotenv
 
@@ -21,8 +22,10 @@ __all__ = [
     "__version__"
 ]
 
-# Print debug info in development
+# Print debug info in development; debug logging stays off (WARNING) otherwise
 if os.getenv("DEBUG", "false").lower() == "true":
+    logging.basicConfig()
+    logging.getLogger(__name__).setLevel(logging.DEBUG)
     print(f"Marketing Agents v{__version__}")
     print(f"Environment loaded: {'TAVILY_API_KEY' in os.environ}")
     print(f"Current directory: {os.getcwd()}")
\ No newline at end of file
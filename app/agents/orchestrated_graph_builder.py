@@ -5,20 +5,112 @@ Simplified version focusing on core functionality.
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any, Set
+import logging
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import List, Optional, Dict, Any, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
-from datetime import datetime
 from pathlib import Path
 import json
+import re
+import time
 
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage, AIMessage
 
 from app.models.orchestration_state import OrchestrationState, DependencyGraph, ExecutionPlan
-from app.utils.config_loader import ConfigurationLoader, inject_managed_agents_into_prompts
-from app.utils.message_utils import extract_original_task
+from app.utils.config_loader import ConfigurationLoader, GLOBAL_TOOL_REGISTRY, inject_managed_agents_into_prompts
+from app.utils.message_utils import extract_original_task, build_cached_prompt, truncate_for_prompt
+from app.utils.llm_cache import LLMResponseCache
+from app.monitoring.streaming_monitor import get_global_streaming_monitor
+
+logger = logging.getLogger(__name__)
+
+# Plan post-processing heuristics, compiled once for single-pass case-insensitive checks
+_CONTENT_ACTION_RE = re.compile(r"write|create|post", re.I)
+_BASIC_EXECUTION_RE = re.compile(r"write a|create a", re.I)
+
+# Tools whose worker LLM call only turns the task into a search query
+_SEARCH_TOOL_NAMES = frozenset({"tavily_search", "mock_search"})
+
+
+def _tool_name(tool: Any) -> str:
+    """Get a tool's registered name, falling back to its string form"""
+    return getattr(getattr(tool, 'metadata', None), 'name', None) or str(tool)
+
+
+def _looks_like_search_query(task: str) -> bool:
+    """Check whether a task is short and simple enough to be searched as-is"""
+    task = task.strip()
+    return (
+        0 < len(task) <= 120
+        and "\n" not in task
+        and task.count(" ") <= 16
+        and "?" not in task[:-1]
+    )
+
+
+def _check_routing_decision(content: str, valid_nodes: frozenset) -> str:
+    """Ensure a routing response is a JSON decision naming a known node, and return it"""
+    decision = json.loads(content)
+    if not isinstance(decision, dict) or decision.get("next_node") not in valid_nodes:
+        raise ValueError(f"Invalid routing decision: {content[:100]}")
+    return content
+
+
+# Prompt templates, bound to str.format once at import
+_WORKER_TASK_PROMPT = """Task to execute: {task}
+{feedback}
+
+Please complete this specific task.""".format
+
+_ROUTING_PROMPT = """Available agents: {agents}
+
+Current task: {task}
+
+Please route to the most appropriate agent or FINISH if complete.
+If several agents can work on the current task independently, list them all in 'parallel_nodes' to run them concurrently.
+IMPORTANT: You MUST provide specific, tailored instructions for the selected agent in the 'instructions' field.
+
+Output format: {{"next_node": "agent_name", "parallel_nodes": [], "reasoning": "explanation", "confidence": 0.95, "should_terminate": false, "instructions": "Specific task for the agent"}}""".format
+
+_PLANNING_SYSTEM_PROMPT = """You are the orchestration manager.
+
+Available Agents and their roles:
+{agents}
+
+Please generate specific, tailored instructions for EACH agent to contribute to the Overall Goal given by the user.
+
+CRITICAL RULES:
+1. IGNORE specific platform constraints in the Overall Goal if they don't match the agent's role.
+   - Example: If Goal says "Post on LinkedIn", the Twitter Agent MUST "Post on Twitter", NOT LinkedIn.
+2. Each agent MUST receive a UNIQUE task suited to their specific capabilities. Do NOT copy-paste tasks.
+3. An analytics agent must receive an ANALYSIS task, never a content creation task.
+4. A strategy agent must receive a STRATEGY task (planning/review), not execution.
+
+Output JSON format:
+{{
+    "subtasks": [
+        {{
+            "agent": "agent_name",
+            "role_analysis": "Brief analysis of what this agent should do...",
+            "instruction": "Specific tailored instruction for this agent..."
+        }}
+    ]
+}}""".format
+
+# Approval options, reprinted after every invalid or view-only choice
+_APPROVAL_MENU = """
+Options:
+1. Approve - Execute the tools
+2. Reject - Skip tool execution
+3. View full content
+4. Provide feedback - Give guidance to improve the content
+
+Enter your choice (1/2/3/4): """
 
 
 class GraphType(Enum):
@@ -34,7 +126,7 @@ class AgentType(Enum):
     WORKER = "worker"
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphBuildState:
     """State for recursive graph building"""
     builder: StateGraph
@@ -45,6 +137,9 @@ class GraphBuildState:
 class OrchestratedGraphBuilder:
     """Builds orchestrated agent workflows with dependency resolution"""
     
+    # Resolved config paths keyed by (working directory, requested path), shared by all builders
+    _resolved_path_cache: Dict[Tuple[str, str], str] = {}
+    
     def __init__(self, config_path: str = "config/agents.yaml"):
         self.config_path = self._resolve_config_path(config_path)
         self.config_loader = ConfigurationLoader(self.config_path)
@@ -52,35 +147,60 @@ class OrchestratedGraphBuilder:
         
         inject_managed_agents_into_prompts(self.agent_config_manager)
         
-        from app.utils.config_loader import GLOBAL_TOOL_REGISTRY
         self.tool_registry = GLOBAL_TOOL_REGISTRY
         
         self.dependency_graph = DependencyGraph(self.agent_config_manager.agents)
         self._node_cache: Dict[str, Any] = {}
+        self._graph_cache: Dict[str, Any] = {}
+        
+        # Bound once here so nodes don't look the global monitor up on every call
+        self.monitor = get_global_streaming_monitor()
+        
+        # Cap concurrent LLM calls when a supervisor fans out to several workers
+        defaults = self.config_loader.raw_config.get('defaults', {})
+        self.max_parallel_agents = defaults.get('max_parallel_agents', 3)
+        # A semaphore is bound to the loop it is first used on, so it is created per running loop
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self._llm_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Optional end-to-end budget (seconds) that caps each LLM call's timeout
+        self.workflow_timeout = defaults.get('workflow_timeout')
+        
+        # Reuse routing decisions and opted-in worker responses for repeated tasks (0 disables the cache)
+        self.llm_cache = LLMResponseCache(defaults.get('llm_cache_size', 256))
         self._agent_type_cache: Dict[str, AgentType] = {}
+        self._worker_execution_order: Optional[List[str]] = None
+        self._worker_levels: Optional[List[List[str]]] = None
+        
+        # input() blocks, so approval prompts read stdin on one dedicated thread
+        # rather than tying up the loop's default executor; started on first prompt
+        self._stdin_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Tool output handlers by tool name; other tools use _run_generic_tool
+        self._tool_handlers = {
+            "tavily_search": self._run_search_tool,
+            "mock_search": self._run_search_tool,
+            "linkedin_post": self._run_linkedin_tool
+        }
     
     def _resolve_config_path(self, config_path: str) -> str:
         """Resolve configuration file path with fallback logic"""
-        path = Path(config_path)
-        
-        if path.is_absolute() and path.exists():
-            return str(path)
-        
-        if path.exists():
-            return str(path)
-        
-        config_dir_path = Path("config") / path
-        if config_dir_path.exists():
-            return str(config_dir_path)
+        cache_key = (os.getcwd(), config_path)
+        resolved = self._resolved_path_cache.get(cache_key)
+        if resolved is not None:
+            return resolved
         
+        # Candidates in priority order; the default "config/agents.yaml" matches the first
+        path = Path(config_path)
+        candidates = [path, Path("config") / path]
         if not path.suffix:
             yaml_path = Path(str(path) + ".yaml")
-            if yaml_path.exists():
-                return str(yaml_path)
-            
-            config_yaml_path = Path("config") / yaml_path
-            if config_yaml_path.exists():
-                return str(config_yaml_path)
+            candidates += [yaml_path, Path("config") / yaml_path]
+        
+        for candidate in candidates:
+            if candidate.exists():
+                resolved = self._resolved_path_cache[cache_key] = str(candidate)
+                return resolved
         
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
@@ -105,6 +225,33 @@ class OrchestratedGraphBuilder:
         self._agent_type_cache[agent_name] = agent_type
         return agent_type
     
+    def _get_worker_execution_order(self) -> List[str]:
+        """Topological order of worker agents, computed once since the config is fixed"""
+        if self._worker_execution_order is None:
+            self._worker_execution_order = [
+                agent_name for agent_name in self.dependency_graph.get_topological_order()
+                if self._get_agent_type(agent_name) == AgentType.WORKER
+            ]
+        return self._worker_execution_order
+    
+    def _get_worker_levels(self) -> List[List[str]]:
+        """Worker agents grouped by dependency level, computed once since the config is fixed"""
+        if self._worker_levels is None:
+            levels = (
+                [agent_name for agent_name in level if self._get_agent_type(agent_name) == AgentType.WORKER]
+                for level in self.dependency_graph.get_level_sets()
+            )
+            self._worker_levels = [level for level in levels if level]
+        return self._worker_levels
+    
+    def _get_next_worker_level(self, agent_name: str) -> List[str]:
+        """Workers the graph starts once the given worker's level is done"""
+        levels = self._get_worker_levels()
+        for index, level in enumerate(levels):
+            if agent_name in level:
+                return levels[index + 1] if index + 1 < len(levels) else []
+        return []
+    
     def validate_entry_point(self, entry_point: str) -> bool:
         """Check if entry point is valid"""
         return entry_point in self.agent_config_manager.agents
@@ -113,17 +260,18 @@ class OrchestratedGraphBuilder:
         """Validate configuration for graph building"""
         errors = []
         
-        # Check for cycles in dependency graph
+        agents = self.agent_config_manager.agents
+        if not agents:
+            errors.append("No agents found in configuration")
+        
+        # Check for cycles in dependency graph (memoized, so graph building reuses it)
         try:
-            order = self.dependency_graph.get_topological_order()
-            if not order:
-                errors.append("No agents found in configuration")
+            self._get_worker_execution_order()
         except ValueError as e:
             errors.append(f"Cycle detected in dependency graph: {e}")
         
         # Check that all agents have valid configurations
-        for agent_name in self.agent_config_manager.agents:
-            config = self.get_agent_config(agent_name)
+        for agent_name, config in agents.items():
             if not config:
                 errors.append(f"Agent '{agent_name}' has no configuration")
             elif not config.system_prompt:
@@ -158,14 +306,23 @@ class OrchestratedGraphBuilder:
         if not self.validate_entry_point(entry_point):
             raise ValueError(f"Entry point '{entry_point}' not found in configuration")
         
+        # Compiled graphs hold no run state, so reuse them per entry point. Graphs
+        # with a checkpointer are not cached, so the cache never keeps one alive.
+        if checkpointer is None and entry_point in self._graph_cache:
+            return self._graph_cache[entry_point]
+        
         agent_type = self._get_agent_type(entry_point)
         
         if agent_type == AgentType.WORKER:
-            return self._build_single_agent_graph(entry_point, checkpointer)
+            graph = self._build_single_agent_graph(entry_point, checkpointer)
         elif entry_point == "main_supervisor":
-            return self._build_orchestrated_graph(entry_point, checkpointer)
+            graph = self._build_orchestrated_graph(entry_point, checkpointer)
         else:
-            return self._build_team_graph(entry_point, checkpointer)
+            graph = self._build_team_graph(entry_point, checkpointer)
+        
+        if checkpointer is None:
+            self._graph_cache[entry_point] = graph
+        return graph
     
     def _build_single_agent_graph(self, agent_name: str, checkpointer=None):
         """Build graph for a single worker agent"""
@@ -184,7 +341,9 @@ class OrchestratedGraphBuilder:
             # Add conditional edge for feedback loop
             # For single agent graphs, we need to handle the routing differently
             def single_agent_router(state):
-                if state.get("human_feedback") and state.get("pending_approval", {}).get("agent") == agent_name:
+                # pending_approval is cleared to None after a decision, so default with `or`
+                pending_approval = state.get("pending_approval") or {}
+                if state.get("human_feedback") and pending_approval.get("agent") == agent_name:
                     return agent_name
                 else:
                     return END
@@ -232,11 +391,7 @@ class OrchestratedGraphBuilder:
         builder.add_node("task_analysis", task_analysis_node)
         
         # Get execution order and filter out supervisors (only workers execute in orchestrated mode)
-        execution_order = self.dependency_graph.get_topological_order()
-        worker_execution_order = [
-            agent_name for agent_name in execution_order
-            if self._get_agent_type(agent_name) == AgentType.WORKER
-        ]
+        worker_execution_order = self._get_worker_execution_order()
         
         # Create agent execution nodes for workers only
         for agent_name in worker_execution_order:
@@ -254,18 +409,14 @@ class OrchestratedGraphBuilder:
         # Build edges
         builder.add_edge(START, "task_analysis")
         
-        if worker_execution_order:
-            builder.add_edge("task_analysis", worker_execution_order[0])
-            
-            for i in range(len(worker_execution_order) - 1):
-                current = worker_execution_order[i]
-                next_agent = worker_execution_order[i + 1]
-                builder.add_edge(current, next_agent)
-            
-            last_agent = worker_execution_order[-1]
-            builder.add_edge(last_agent, "result_synthesis")
-        else:
-            builder.add_edge("task_analysis", "result_synthesis")
+        # Group workers by dependency level so independent workers run in the same
+        # step; each level waits for every worker of the previous one
+        previous = "task_analysis"
+        for level in self._get_worker_levels():
+            for agent_name in level:
+                builder.add_edge(previous, agent_name)
+            previous = level if len(level) > 1 else level[0]
+        builder.add_edge(previous, "result_synthesis")
         
         # Add conditional edges for agents that require approval to go to human_approval node
         for agent_name in worker_execution_order:
@@ -289,39 +440,60 @@ class OrchestratedGraphBuilder:
     
     def _post_process_plan(self, subtasks: List[Dict], original_task: str) -> List[Dict]:
         """Refine plan to ensure role alignment using heuristics"""
-        print(f"DEBUG: Post-processing plan with {len(subtasks)} subtasks")
+        logger.debug("Post-processing plan with %d subtasks", len(subtasks))
         for subtask in subtasks:
             agent = subtask.get("agent", "")
             instruction = subtask.get("instruction", "")
-            print(f"DEBUG: Checking agent {agent} with instruction: {instruction[:50]}...")
+            logger.debug("Checking agent %s with instruction: %.50s...", agent, instruction)
+            agent_lower = agent.lower()
             
             # Heuristic 1: Analytics agents should analyze, not create content
-            if "analytics" in agent.lower():
-                if "write" in instruction.lower() or "create" in instruction.lower() or "post" in instruction.lower():
-                     print(f"DEBUG: Correcting Analytics Agent instruction")
+            if "analytics" in agent_lower:
+                if _CONTENT_ACTION_RE.search(instruction):
+                     logger.debug("Correcting Analytics Agent instruction")
                      subtask["instruction"] = f"Define KPIs, success metrics, and an analysis plan for: {original_task}"
                  
             # Heuristic 2: Strategy agents should strategize, not execute basic tasks
-            if "strategy" in agent.lower() and ("write a" in instruction.lower() or "create a" in instruction.lower()):
-                 print(f"DEBUG: Correcting Strategy Agent instruction")
+            if "strategy" in agent_lower and _BASIC_EXECUTION_RE.search(instruction):
+                 logger.debug("Correcting Strategy Agent instruction")
                  subtask["instruction"] = f"Develop a comprehensive strategic outline for: {original_task}"
                  
             # Heuristic 3: Platform mismatch (Twitter vs LinkedIn)
-            if "twitter" in agent.lower() and "linkedin" in instruction.lower():
-                 print(f"DEBUG: Correcting Twitter/LinkedIn mismatch")
+            if "twitter" in agent_lower and "linkedin" in instruction.lower():
+                 logger.debug("Correcting Twitter/LinkedIn mismatch")
                  subtask["instruction"] = instruction.replace("LinkedIn", "Twitter").replace("linkedin", "twitter")
                  # Force generic if replacement isn't enough
                  if "Twitter" not in subtask["instruction"] and "twitter" not in subtask["instruction"]:
                      subtask["instruction"] = f"Create engaging Twitter content for: {original_task}"
             
-            if "linkedin" in agent.lower() and "twitter" in instruction.lower():
-                 print(f"DEBUG: Correcting LinkedIn/Twitter mismatch")
+            if "linkedin" in agent_lower and "twitter" in instruction.lower():
+                 logger.debug("Correcting LinkedIn/Twitter mismatch")
                  subtask["instruction"] = instruction.replace("Twitter", "LinkedIn").replace("twitter", "linkedin")
                  
         return subtasks
 
     def _create_task_analysis_node(self, entry_point: str):
         """Create node for task analysis and planning"""
+        # The agent roster and planning instructions depend only on the config,
+        # so build the planning system prompt once per node
+        agent_info = []
+        for agent in self._get_worker_execution_order():
+            config = self.get_agent_config(agent)
+            # Extract first line or summary of system prompt as role description
+            role_desc = config.system_prompt.partition('\n')[0] if config.system_prompt else "No description"
+            agent_info.append(f"- {agent}: {role_desc}")
+        
+        # Static instructions and the agent roster go in the system message so
+        # the prefix is identical across runs and providers can cache it
+        planning_system_prompt = _PLANNING_SYSTEM_PROMPT(agents="\n".join(agent_info))
+        
+        # Each worker's dependencies on other workers are also fixed by the config
+        worker_execution_order = self._get_worker_execution_order()
+        worker_dependencies = {
+            agent: [dep for dep in self.dependency_graph.graph.get(agent, []) if dep in worker_execution_order]
+            for agent in worker_execution_order
+        }
+        
         async def task_analysis_node(state: Dict[str, Any]) -> Command:
             """Analyze task and create execution plan"""
             try:
@@ -330,57 +502,20 @@ class OrchestratedGraphBuilder:
                     original_task = state.get("original_task", "No task provided")
                 
                 # Get execution order from dependency graph and filter out supervisors
-                execution_order = self.dependency_graph.get_topological_order()
-                worker_execution_order = [
-                    agent_name for agent_name in execution_order
-                    if self._get_agent_type(agent_name) == AgentType.WORKER
-                ]
+                worker_execution_order = self._get_worker_execution_order()
                 
                 # Generate tailored plan using LLM
                 agent_config = self.get_agent_config(entry_point)
                 llm = agent_config.get_model()
                 
-                # Gather agent info with role descriptions
-                agent_info = []
-                for agent in worker_execution_order:
-                    config = self.get_agent_config(agent)
-                    # Extract first line or summary of system prompt as role description
-                    role_desc = config.system_prompt.split('\n')[0] if config.system_prompt else "No description"
-                    agent_info.append(f"- {agent}: {role_desc}")
-                
-                planning_prompt = f"""You are the orchestration manager.
-                
-                Overall Goal: {original_task}
-                
-                Available Agents and their roles:
-                {chr(10).join(agent_info)}
-                
-                Please generate specific, tailored instructions for EACH agent to contribute to the Overall Goal.
-                
-                CRITICAL RULES:
-                1. IGNORE specific platform constraints in the Overall Goal if they don't match the agent's role.
-                   - Example: If Goal says "Post on LinkedIn", the Twitter Agent MUST "Post on Twitter", NOT LinkedIn.
-                2. Each agent MUST receive a UNIQUE task suited to their specific capabilities. Do NOT copy-paste tasks.
-                3. An analytics agent must receive an ANALYSIS task, never a content creation task.
-                4. A strategy agent must receive a STRATEGY task (planning/review), not execution.
-                
-                Output JSON format:
-                {{
-                    "subtasks": [
-                        {{
-                            "agent": "agent_name",
-                            "role_analysis": "Brief analysis of what this agent should do...",
-                            "instruction": "Specific tailored instruction for this agent..."
-                        }}
-                    ]
-                }}
-                """
+                planning_prompt = f"Overall Goal: {original_task}"
                 
                 try:
-                    response = await asyncio.wait_for(
-                        llm.ainvoke([{"role": "user", "content": planning_prompt}]),
-                        timeout=30.0
-                    )
+                    async with asyncio.timeout(self._llm_timeout(state, agent_config)):
+                        response = await llm.ainvoke(
+                            build_cached_prompt(planning_system_prompt, planning_prompt),
+                            **agent_config.get_prompt_cache_kwargs()
+                        )
                     # Robust JSON extraction
                     content = response.content
                     try:
@@ -391,10 +526,10 @@ class OrchestratedGraphBuilder:
                             json_str = content[start_idx:end_idx+1]
                             plan_data = json.loads(json_str)
                         else:
-                            print("DEBUG: No JSON found in LLM response")
+                            logger.debug("No JSON found in LLM response")
                             plan_data = {}
                     except json.JSONDecodeError as e:
-                        print(f"DEBUG: JSON decode error: {e}")
+                        logger.debug("JSON decode error: %s", e)
                         plan_data = {}
                     raw_subtasks = plan_data.get("subtasks", [])
                     
@@ -408,15 +543,17 @@ class OrchestratedGraphBuilder:
 
                 # Create execution plan
                 execution_plan = ExecutionPlan(
-                    task_id=f"task_{datetime.now().timestamp()}",
+                    task_id=f"task_{time.time_ns()}",
                     original_task=original_task,
                     subtasks=[
                         {
-                            "description": tailored_subtasks.get(agent, f"Execute {agent}'s part of: {original_task}"),
+                            # Untailored subtasks are described from original_task when
+                            # read, rather than each holding its own copy of the task
+                            "description": tailored_subtasks.get(agent),
                             "assigned_to": agent,
-                            "dependencies": [] if i == 0 else [worker_execution_order[i-1]]
+                            "dependencies": worker_dependencies[agent]
                         }
-                        for i, agent in enumerate(worker_execution_order)
+                        for agent in worker_execution_order
                     ],
                     execution_order=worker_execution_order,
                     current_step=0,
@@ -425,36 +562,28 @@ class OrchestratedGraphBuilder:
                 )
                 
                 # Record task analysis in monitoring
-                try:
-                    from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                    monitor = get_global_streaming_monitor()
-                    monitor.record_agent_output("task_analysis", f"Created execution plan with {len(worker_execution_order)} agents: {', '.join(worker_execution_order)}")
-                except Exception as e:
-                    print(f"Failed to record task analysis: {e}")
+                if self.monitor.output_logging_enabled:
+                    self._record("task analysis", self.monitor.record_agent_output, "task_analysis", f"Created execution plan with {len(worker_execution_order)} agents: {', '.join(worker_execution_order)}")
                 
                 first_agent = execution_plan.get_current_agent()
                 if first_agent:
                     # Record handoff to first agent
-                    try:
-                        from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                        monitor = get_global_streaming_monitor()
-                        monitor.record_agent_interaction(
-                            "task_analysis",
-                            first_agent,
-                            "start_execution",
-                            {"plan_summary": f"Execute {len(worker_execution_order)} agents"}
-                        )
-                    except Exception as e:
-                        print(f"Failed to record handoff: {e}")
+                    self._record(
+                        "handoff", self.monitor.record_agent_interaction,
+                        "task_analysis",
+                        first_agent,
+                        "start_execution",
+                        {"plan_summary": f"Execute {len(worker_execution_order)} agents"}
+                    )
                     
-                    first_subtask = execution_plan.subtasks[0]["description"] if execution_plan.subtasks else original_task
+                    first_subtask = self._describe_subtask(execution_plan.subtasks[0], original_task) if execution_plan.subtasks else original_task
                     
                     return Command(
                         goto=first_agent,
                         update={
                             "current_agent": first_agent,
                             "task_status": "execution_started",
-                            "execution_plan": execution_plan.dict(),
+                            "execution_plan": execution_plan,
                             "original_task": original_task,
                             "current_task": first_subtask
                         }
@@ -464,7 +593,7 @@ class OrchestratedGraphBuilder:
                         goto="result_synthesis",
                         update={
                             "task_status": "no_agents_to_execute",
-                            "execution_plan": execution_plan.dict(),
+                            "execution_plan": execution_plan,
                             "original_task": original_task
                         }
                     )
@@ -481,78 +610,34 @@ class OrchestratedGraphBuilder:
         
         return task_analysis_node
     
-    def _tailor_task_for_agent(self, original_task: str, agent_name: str, agent_role: str) -> str:
-        """Tailor task for specific agent based on its role and context"""
-        agent_config = self.get_agent_config(agent_name)
-        if not agent_config:
-            return original_task
-            
-        # Get agent's dependencies to understand context
-        dependencies = getattr(agent_config, 'depends_on', [])
-        
-        # Task tailoring logic based on agent role and dependencies
-        tailored_task = original_task
-        
-        # SEO Specialist: Focus on optimization and visibility
-        if agent_name == "seo_specialist":
-            tailored_task = f"Optimize the following content for SEO to maximize search engine visibility and engagement:\n\n{original_task}"
-            
-        # LinkedIn Manager: Focus on professional posting
-        elif agent_name == "linkedin_manager":
-            tailored_task = f"Create a professional and engaging LinkedIn post based on this content:\n\n{original_task}"
-            
-        # Content Writer: Focus on content creation
-        elif agent_name == "content_writer":
-            tailored_task = f"Write compelling content based on this request:\n\n{original_task}"
-            
-        # Web Researcher: Focus on information gathering
-        elif agent_name == "web_researcher":
-            tailored_task = f"Research and gather information related to:\n\n{original_task}"
-            
-        # Data Analyst: Focus on analysis
-        elif agent_name == "data_analyst":
-            tailored_task = f"Analyze data and provide insights related to:\n\n{original_task}"
-            
-        # Twitter Manager: Focus on tweets
-        elif agent_name == "twitter_manager":
-            tailored_task = f"Create engaging Twitter content based on this request:\n\n{original_task}"
-            
-        # Analytics Tracker: Focus on metrics and performance
-        elif agent_name == "analytics_tracker":
-            tailored_task = f"Analyze performance metrics and potential reach for:\n\n{original_task}"
-            
-        # Strategy Agent: Focus on overall strategy
-        elif agent_name == "strategy_agent":
-            tailored_task = f"Develop a comprehensive marketing strategy for:\n\n{original_task}"
-            
-        # Visual Designer: Focus on visuals
-        elif agent_name == "visual_designer":
-            tailored_task = f"Create visual concepts and assets for:\n\n{original_task}"
-            
-        # Community Manager: Focus on engagement
-        elif agent_name == "community_manager":
-            tailored_task = f"Plan community engagement and interaction for:\n\n{original_task}"
-            
-        # Add context about dependencies if available
-        if dependencies:
-            context_info = ", ".join(dependencies)
-            tailored_task += f"\n\nContext: This task depends on output from: {context_info}"
-            
-        return tailored_task
-
     def _create_worker_node(self, worker_name: str, supervisor_name: Optional[str] = None):
         """Create worker node function"""
         cache_key = f"{worker_name}:{supervisor_name}" if supervisor_name else worker_name
         if cache_key in self._node_cache:
             return self._node_cache[cache_key]
         
+        node_config = self.get_agent_config(worker_name)
+        worker_tools = (node_config.tools if node_config else None) or []
+        uses_search = any(
+            _tool_name(tool) in _SEARCH_TOOL_NAMES
+            for tool in worker_tools
+        )
+        # Config and cache kwargs are fixed for the node's lifetime, so resolve them once
+        prompt_cache_kwargs = node_config.get_prompt_cache_kwargs() if node_config else {}
+        
         async def worker_node(state: Dict[str, Any]) -> Command:
             """Worker agent with tools"""
             try:
-                worker_config = self.get_agent_config(worker_name)
+                worker_config = node_config
                 
-                # Get task from state dict
-                current_task = state.get("current_task") or state.get("original_task") or "No task provided"
+                # Get task from state dict; under a plan each worker takes its own subtask,
+                # since workers in the same dependency level run concurrently
+                current_task = (
+                    self._get_planned_subtask(state, worker_name)
+                    or state.get("current_task")
+                    or state.get("original_task")
+                    or "No task provided"
+                )
                 
                 # Use current task (which should be tailored by supervisor/planner)
                 tailored_task = current_task
@@ -566,31 +651,44 @@ class OrchestratedGraphBuilder:
                 if human_feedback:
                     feedback_section = f"\n\n📝 HUMAN FEEDBACK RECEIVED:\n{human_feedback}\n\nPlease revise your work based on this feedback."
                  
-                # Create prompt with tailored task and feedback
-                prompt = f"""{worker_config.system_prompt}
-
-Task to execute: {tailored_task}
-{feedback_section}
-
-Please complete this specific task."""
+                # Create prompt with tailored task and feedback; the system prompt
+                # is sent as its own message so providers can cache it
+                task_prompt = _WORKER_TASK_PROMPT(task=truncate_for_prompt(tailored_task), feedback=feedback_section)
+                messages = build_cached_prompt(worker_config.system_prompt, task_prompt)
                 
                 # Record prompt in monitoring
-                try:
-                    from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                    monitor = get_global_streaming_monitor()
-                    monitor.record_agent_prompt(worker_name, prompt)
-                except Exception as e:
-                    print(f"Failed to record prompt: {e}")
+                if self.monitor.prompt_logging_enabled:
+                    self._record("prompt", self.monitor.record_agent_prompt, worker_name, f"{worker_config.system_prompt}\n\n{task_prompt}")
                 
-                # Execute LLM call
+                async def call_llm() -> str:
+                    # Stream the completion so the timeout covers the whole generation
+                    # without holding one large response in the client
+                    chunks = []
+                    async with self._get_llm_semaphore(), asyncio.timeout(self._llm_timeout(state, worker_config)):
+                        async for chunk in llm.astream(messages, **prompt_cache_kwargs):
+                            chunks.append(chunk.content)
+                    return "".join(chunks)
+                
+                # Execute LLM call through the response cache when the agent opts in;
+                # generated content and revisions requested through human feedback
+                # always go to the model.
                 try:
-                    response = await asyncio.wait_for(
-                        llm.ainvoke([{"role": "user", "content": prompt}]),
-                        timeout=30.0
-                    )
-                    result = response.content
+                    if human_feedback:
+                        result = await call_llm()
+                    elif (uses_search and tailored_task == self._get_original_task(state)
+                          and _looks_like_search_query(tailored_task)):
+                        # The user's request reached this worker untouched and already reads
+                        # as a search query; skip query generation. Planner subtasks and
+                        # supervisor instructions always go through the LLM.
+                        result = tailored_task.strip()
+                    elif worker_config.cache_responses:
+                        result = await self.llm_cache.get_or_compute(
+                            worker_name, worker_config.system_prompt, tailored_task, call_llm
+                        )
+                    else:
+                        result = await call_llm()
                 except asyncio.TimeoutError:
-                    result = f"LLM call timed out after 30 seconds."
+                    result = "LLM call timed out."
                     print(f"{worker_name}: LLM timeout")
                 except Exception as e:
                     result = f"LLM call failed: {str(e)[:200]}"
@@ -599,29 +697,25 @@ Please complete this specific task."""
                 # Check if human approval is required before executing tools
                 if worker_config.require_approval and worker_config.tools:
                     # Record that approval is needed
-                    try:
-                        from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                        monitor = get_global_streaming_monitor()
-                        monitor.record_agent_interaction(
-                            worker_name,
-                            "human_approval",
-                            "awaiting_approval",
-                            {"tool_count": len(worker_config.tools), "content_preview": result[:200]}
-                        )
-                    except Exception as e:
-                        print(f"Failed to record approval request: {e}")
+                    self._record(
+                        "approval request", self.monitor.record_agent_interaction,
+                        worker_name,
+                        "human_approval",
+                        "awaiting_approval",
+                        {"tool_count": len(worker_config.tools), "content_preview": result[:200]}
+                    )
                     
                     # Return to human approval node
                     return Command(
                         goto="human_approval",
                         update={
-                            "messages": state.get("messages", []) + [
+                            "messages": [
                                 AIMessage(content=result, name=worker_name)
                             ],
                             "pending_approval": {
                                 "agent": worker_name,
                                 "content": result,
-                                "tools": [tool.metadata.name if hasattr(tool, 'metadata') and hasattr(tool.metadata, 'name') else str(tool) for tool in worker_config.tools],
+                                "tools": [_tool_name(tool) for tool in worker_config.tools],
                                 "require_approval": True
                             },
                             "agent_results": {worker_name: f"[AWAITING APPROVAL] {result[:100]}..."}
@@ -633,16 +727,12 @@ Please complete this specific task."""
                     result = await self._handle_worker_tools(worker_name, result, worker_config.tools)
                 
                 # Record output in monitoring
-                try:
-                    from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                    monitor = get_global_streaming_monitor()
-                    monitor.record_agent_output(worker_name, result)
-                except Exception as e:
-                    print(f"Failed to record output: {e}")
+                if self.monitor.output_logging_enabled:
+                    self._record("output", self.monitor.record_agent_output, worker_name, result)
                 
-                # Update state with result
+                # Update state with result (messages is reduced by add_messages, so only the new message is returned)
                 update_data = {
-                    "messages": state.get("messages", []) + [
+                    "messages": [
                         AIMessage(content=result, name=worker_name)
                     ],
                     "agent_results": {worker_name: result},
@@ -650,204 +740,310 @@ Please complete this specific task."""
                 }
                 
                 # Get next agent from execution plan if available
-                execution_plan = state.get("execution_plan")
-                if execution_plan:
-                    # Convert dict to ExecutionPlan if needed
-                    if isinstance(execution_plan, dict):
-                        from app.models.orchestration_state import ExecutionPlan
-                        execution_plan = ExecutionPlan(**execution_plan)
-                    
-                    # Mark agent as complete
-                    execution_plan.mark_agent_complete(worker_name, result)
-                    
-                    # Get next agent
-                    next_agent = execution_plan.get_current_agent()
-                    if next_agent:
-                        update_data["execution_plan"] = execution_plan.dict()
-                        update_data["current_agent"] = next_agent
-                        
-                        # Update current_task for next agent
-                        task_found = False
-                        for subtask in execution_plan.subtasks:
-                            if subtask["assigned_to"] == next_agent:
-                                update_data["current_task"] = subtask["description"]
-                                task_found = True
-                                break
-                        
-                        if not task_found:
-                            # Failsafe: Generate generic task if tailored one not found
-                            original = state.get("original_task", "the task")
-                            update_data["current_task"] = f"Execute {next_agent}'s part of: {original}"
-                            print(f"Warning: No tailored task found for {next_agent}, using generic fallback.")
-                        
-                        # Record handoff decision
-                        try:
-                            from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                            monitor = get_global_streaming_monitor()
-                            monitor.record_agent_interaction(
-                                worker_name,
-                                next_agent,
-                                "handoff",
-                                {"reason": "Dependency chain", "result_summary": result[:100]}
-                            )
-                        except Exception as e:
-                            print(f"Failed to record handoff: {e}")
-                        
-                        return Command(goto=next_agent, update=update_data)
-                
-                # No next agent, go to result synthesis
-                return Command(goto="result_synthesis", update=update_data)
+                return self._route_to_next_agent(
+                    state, worker_name, result, update_data, record_handoff=True
+                )
                     
             except Exception as e:
                 print(f"{worker_name} failed: {e}")
                 error_result = f"{worker_name} failed: {str(e)[:200]}"
                 
                 # Record error output
-                try:
-                    from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                    monitor = get_global_streaming_monitor()
-                    monitor.record_agent_output(worker_name, error_result)
-                except Exception as e:
-                    print(f"Failed to record error output: {e}")
+                if self.monitor.output_logging_enabled:
+                    self._record("error output", self.monitor.record_agent_output, worker_name, error_result)
                 
                 update_data = {
-                    "messages": state.get("messages", []) + [
+                    "messages": [
                         AIMessage(content=error_result, name=worker_name)
                     ],
                     "agent_results": {worker_name: error_result}
                 }
                 
                 # Try to get next agent
-                execution_plan = state.get("execution_plan")
-                if execution_plan:
-                    if isinstance(execution_plan, dict):
-                        from app.models.orchestration_state import ExecutionPlan
-                        execution_plan = ExecutionPlan(**execution_plan)
-                    
-                    execution_plan.mark_agent_complete(worker_name, error_result)
-                    next_agent = execution_plan.get_current_agent()
-                    if next_agent:
-                        update_data["execution_plan"] = execution_plan.dict()
-                        update_data["current_agent"] = next_agent
-                        return Command(goto=next_agent, update=update_data)
-                
-                return Command(goto="result_synthesis", update=update_data)
+                return self._route_to_next_agent(state, worker_name, error_result, update_data)
         
         self._node_cache[cache_key] = worker_node
         return worker_node
     
+    def _llm_timeout(self, state: Dict[str, Any], agent_config) -> float:
+        """Time for an LLM call and all of its client retries, capped by what is left of the workflow budget"""
+        # Each attempt gets request_timeout, so leave room for every retry the client makes
+        call_budget = agent_config.request_timeout * ((agent_config.max_retries or 0) + 1)
+        deadline = state.get("deadline")
+        if deadline is None:
+            return call_budget
+        
+        return max(0.0, min(call_budget, deadline - time.time()))
+    
+    def _get_llm_semaphore(self) -> asyncio.Semaphore:
+        """Get the LLM concurrency limit for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(self.max_parallel_agents)
+            self._llm_semaphore_loop = loop
+        return self._llm_semaphore
+    
+    async def aclose(self):
+        """Release tool sessions and the stdin thread once workflows are done"""
+        await self.tool_registry.close_all()
+        if self._stdin_executor is not None:
+            self._stdin_executor.shutdown(wait=False)
+            self._stdin_executor = None
+    
+    async def _read_input(self) -> str:
+        """Read a line from stdin without blocking the event loop"""
+        # Created lazily, so cached graphs keep working after aclose()
+        if self._stdin_executor is None:
+            self._stdin_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hitl-stdin")
+        return await asyncio.get_running_loop().run_in_executor(self._stdin_executor, input)
+    
+    def _record(self, description: str, record_fn, *args):
+        """Schedule a monitor call on the event loop so it stays off the node's critical path"""
+        def run():
+            try:
+                record_fn(*args)
+            except Exception as e:
+                logger.debug("Failed to record %s: %s", description, e)
+        
+        try:
+            asyncio.get_running_loop().call_soon(run)
+        except RuntimeError:
+            # No running loop (sync caller): record inline
+            run()
+    
+    def _route_to_next_agent(self, state: Dict[str, Any], agent_name: str, result: str,
+                             update_data: Dict[str, Any], default_goto: str = "result_synthesis",
+                             record_handoff: bool = False) -> Command:
+        """Mark agent complete in the execution plan and route onwards"""
+        execution_plan = state.get("execution_plan")
+        if not execution_plan:
+            return Command(goto=default_goto, update=update_data)
+        
+        # Wrap a dict plan without revalidating it (plans in state are our own output),
+        # then copy the containers mark_agent_complete mutates, since workers of one
+        # level share the state's plan
+        if isinstance(execution_plan, dict):
+            execution_plan = ExecutionPlan.model_construct(**execution_plan)
+        execution_plan = execution_plan.model_copy(update={
+            "completed_steps": list(execution_plan.completed_steps),
+            "agent_results": dict(execution_plan.agent_results)
+        })
+        
+        execution_plan.mark_agent_complete(agent_name, result)
+        
+        # The state reducer merges ExecutionPlan models directly, so pass the model
+        # rather than dumping it only to have the reducer validate it again
+        update_data["execution_plan"] = execution_plan
+        
+        if execution_plan.is_complete():
+            return Command(goto="result_synthesis", update=update_data)
+        
+        # Workers of one level run in parallel, each advancing its own copy of the
+        # plan, so the plan's current step may point at a sibling. The graph's
+        # level edges decide who runs next, so hand off to the following level.
+        next_agents = self._get_next_worker_level(agent_name)
+        if next_agents:
+            update_data["current_agent"] = next_agents[0]
+        
+        if record_handoff:
+            for next_agent in next_agents:
+                self._record(
+                    "handoff", self.monitor.record_agent_interaction,
+                    agent_name,
+                    next_agent,
+                    "handoff",
+                    {"reason": "Dependency chain", "result_summary": result[:100]}
+                )
+        
+        # The graph's dependency-level edges start the next agents once their
+        # whole level is done, so only the state is updated here
+        return Command(update=update_data)
+    
+    def _get_planned_subtask(self, state: Dict[str, Any], agent_name: str) -> Optional[str]:
+        """Get the agent's subtask description from the execution plan, if any"""
+        execution_plan = state.get("execution_plan")
+        if not execution_plan:
+            return None
+        
+        if isinstance(execution_plan, dict):
+            execution_plan = ExecutionPlan.model_construct(**execution_plan)
+        
+        for subtask in execution_plan.subtasks:
+            if subtask.get("assigned_to") == agent_name:
+                return self._describe_subtask(subtask, execution_plan.original_task)
+        return None
+    
+    @staticmethod
+    def _get_original_task(state: Dict[str, Any]) -> str:
+        """Get the user's original task from state, falling back to the execution plan"""
+        original_task = state.get("original_task")
+        if original_task:
+            return original_task
+        
+        execution_plan = state.get("execution_plan")
+        if isinstance(execution_plan, dict):
+            return execution_plan.get("original_task") or ""
+        return getattr(execution_plan, "original_task", None) or ""
+    
+    @staticmethod
+    def _describe_subtask(subtask: Dict[str, Any], original_task: str) -> str:
+        """Get a subtask's description, falling back to a generic one for untailored subtasks"""
+        return subtask.get("description") or f"Execute {subtask.get('assigned_to')}'s part of: {original_task}"
+    
     async def _handle_worker_tools(self, worker_name: str, content: str, tools: List[Any]) -> str:
         """Handle worker tools based on tool objects"""
-        result = content
-        
+        runnable_tools = []
         for tool in tools:
             if not tool:
                 print(f"Tool object is None for {worker_name}")
                 continue
-                
-            try:
-                tool_name = tool.metadata.name if hasattr(tool, 'metadata') and hasattr(tool.metadata, 'name') else str(tool)
-                
-                if tool_name == "tavily_search" or tool_name == "mock_search":
-                    # For web_researcher, use the generated query to perform search
-                    search_query = content.strip()
-                    if search_query:
-                        search_result = await tool.execute(search_query)
-                        # Format search results nicely
-                        if isinstance(search_result, dict):
-                            answer = search_result.get('answer', 'No answer found')
-                            total_results = search_result.get('total_results', 0)
-                            results = search_result.get('results', [])
-                            
-                            formatted_results = f"Search query: {search_query}\n\n"
-                            formatted_results += f"Answer: {answer}\n\n"
-                            formatted_results += f"Found {total_results} results:\n"
-                            
-                            for i, res in enumerate(results[:3]):  # Show top 3 results
-                                title = res.get('title', 'No title')
-                                url = res.get('url', 'No URL')
-                                content_snippet = res.get('content', '')[:200]
-                                formatted_results += f"\n{i+1}. {title}\n   URL: {url}\n   {content_snippet}...\n"
-                            
-                            result = formatted_results
-                        else:
-                            result = f"Search query: {search_query}\n\nSearch results:\n{search_result}"
-                    else:
-                        result = f"No search query generated for {tool_name}"
-                        
-                elif tool_name == "linkedin_post":
-                    # For linkedin_manager, post the content
-                    post_result = await tool.execute(content)
-                    # Format LinkedIn post result nicely
-                    result = f"🚀 LINKEDIN POST TOOL EXECUTED:\n\n"
-                    result += f"Post content:\n{content}\n\n"
-                    result += f"Post result: {post_result}\n\n"
-                    result += f"Note: This is a {'MOCK' if 'mock' in str(tool).lower() else 'REAL'} LinkedIn post"
-                    
-                else:
-                    # Generic tool execution
-                    tool_result = await tool.execute(content)
-                    result = f"Tool {tool_name} executed: {tool_result[:200]}..."
-                    
-            except Exception as e:
-                result = f"Tool {tool_name if 'tool_name' in locals() else 'unknown'} failed: {str(e)}"
-                print(f"{worker_name}: {result}")
+            runnable_tools.append(tool)
+        
+        if not runnable_tools:
+            return content
+        
+        # Every tool works from the same content, so run them concurrently;
+        # the last tool's output is the worker result, as when run in order
+        results = await asyncio.gather(
+            *(self._run_worker_tool(worker_name, content, tool) for tool in runnable_tools)
+        )
+        return results[-1]
+    
+    async def _run_worker_tool(self, worker_name: str, content: str, tool: Any) -> str:
+        """Execute one worker tool and format its output"""
+        tool_name = _tool_name(tool)
+        handler = self._tool_handlers.get(tool_name, self._run_generic_tool)
+        
+        try:
+            return await handler(tool_name, content, tool)
+        except Exception as e:
+            result = f"Tool {tool_name} failed: {str(e)}"
+            print(f"{worker_name}: {result}")
+            return result
+    
+    async def _run_search_tool(self, tool_name: str, content: str, tool: Any) -> str:
+        """Run a search tool on the worker's generated query"""
+        # For web_researcher, use the generated query to perform search
+        search_query = content.strip()
+        if not search_query:
+            return f"No search query generated for {tool_name}"
+        
+        search_result = await tool.execute(search_query)
+        if not isinstance(search_result, dict):
+            return f"Search query: {search_query}\n\nSearch results:\n{search_result}"
         
+        # Format search results nicely
+        answer = search_result.get('answer', 'No answer found')
+        total_results = search_result.get('total_results', 0)
+        results = search_result.get('results', [])
+        
+        formatted_results = f"Search query: {search_query}\n\n"
+        formatted_results += f"Answer: {answer}\n\n"
+        formatted_results += f"Found {total_results} results:\n"
+        
+        for i, res in enumerate(results[:3]):  # Show top 3 results
+            title = res.get('title', 'No title')
+            url = res.get('url', 'No URL')
+            content_snippet = res.get('content', '')[:200]
+            formatted_results += f"\n{i+1}. {title}\n   URL: {url}\n   {content_snippet}...\n"
+        
+        return formatted_results
+    
+    async def _run_linkedin_tool(self, tool_name: str, content: str, tool: Any) -> str:
+        """Post the worker's content to LinkedIn"""
+        post_result = await tool.execute(content)
+        # Format LinkedIn post result nicely
+        result = f"🚀 LINKEDIN POST TOOL EXECUTED:\n\n"
+        result += f"Post content:\n{content}\n\n"
+        result += f"Post result: {post_result}\n\n"
+        result += f"Note: This is a {'MOCK' if 'mock' in str(tool).lower() else 'REAL'} LinkedIn post"
         return result
     
+    async def _run_generic_tool(self, tool_name: str, content: str, tool: Any) -> str:
+        """Run any other tool on the worker's content"""
+        tool_result = await tool.execute(content)
+        return f"Tool {tool_name} executed: {tool_result[:200]}..."
+    
     def _create_supervisor_node(self, supervisor_name: str, managed_agents: List[str]):
         """Create supervisor node function with dynamic routing and task tailoring"""
+        agents_list = ', '.join(managed_agents)
+        node_config = self.get_agent_config(supervisor_name)
+        prompt_cache_kwargs = node_config.get_prompt_cache_kwargs() if node_config else {}
+        valid_next_nodes = frozenset(managed_agents) | {"FINISH"}
+        
         async def supervisor_node(state: Dict[str, Any]) -> Command:
+            messages = state.get("messages") or []
             try:
-                supervisor_config = self.get_agent_config(supervisor_name)
+                supervisor_config = node_config
                 
                 # Get current task
-                current_task = state.get('messages', [])[-1].content if state.get('messages') else state.get('original_task', 'No task provided')
-                
-                # Provide tailored instructions for each managed agent
-                agent_specific_instructions = "\n".join([
-                    f"- {agent}: {self._tailor_task_for_agent(current_task, agent, 'worker')}"
-                    for agent in managed_agents
-                ])
+                current_task = messages[-1].content if messages else state.get('original_task', 'No task provided')
                 
-                routing_prompt = f"""{supervisor_config.system_prompt}
-
-Available agents: {', '.join(managed_agents)}
-
-Current task: {current_task}
-
-Please route to the most appropriate agent or FINISH if complete.
-IMPORTANT: You MUST provide specific, tailored instructions for the selected agent in the 'instructions' field.
-
-Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confidence": 0.95, "should_terminate": false, "instructions": "Specific task for the agent"}}"""
+                routing_prompt = _ROUTING_PROMPT(agents=agents_list, task=truncate_for_prompt(current_task))
                 
                 llm = supervisor_config.get_model()
                 
-                try:
-                    response = await asyncio.wait_for(
-                        llm.ainvoke([{"role": "user", "content": routing_prompt}]),
-                        timeout=30.0
-                    )
-                    decision = json.loads(response.content)
-                except Exception as e:
-                    print(f"{supervisor_name}: LLM error: {e}")
-                    # Fallback to first agent
-                    decision = {"next_node": managed_agents[0] if managed_agents else "FINISH", "reasoning": "Fallback", "confidence": 0.5, "should_terminate": False}
+                async def call_router() -> str:
+                    # Stream the decision and stop once it parses, so any text the
+                    # model adds after the JSON object doesn't delay routing
+                    chunks = []
+                    async with asyncio.timeout(self._llm_timeout(state, supervisor_config)), aclosing(llm.astream(
+                        build_cached_prompt(supervisor_config.system_prompt, routing_prompt),
+                        **prompt_cache_kwargs
+                    )) as stream:
+                        async for chunk in stream:
+                            chunks.append(chunk.content)
+                            if "}" in chunk.content:
+                                try:
+                                    return _check_routing_decision("".join(chunks), valid_next_nodes)
+                                except json.JSONDecodeError:
+                                    pass
+                    # Validate before returning so unusable decisions are never cached
+                    return _check_routing_decision("".join(chunks), valid_next_nodes)
                 
+                # Settle the trivial cases locally and keep the LLM for real choices
+                agent_results = state.get("agent_results") or {}
+                remaining = [agent for agent in managed_agents if agent not in agent_results]
+                max_iterations = state.get("max_iterations")
+                if not remaining or (max_iterations and state.get("iteration_count", 0) >= max_iterations):
+                    decision = {"next_node": "FINISH", "reasoning": "No agents or iterations left", "confidence": 1.0, "should_terminate": True}
+                elif len(remaining) == 1:
+                    decision = {"next_node": remaining[0], "reasoning": "Only remaining agent", "confidence": 1.0, "should_terminate": False}
+                else:
+                    try:
+                        # Identical tasks get the same routing, so reuse cached decisions
+                        decision = json.loads(await self.llm_cache.get_or_compute(
+                            supervisor_name, supervisor_config.system_prompt, current_task, call_router
+                        ))
+                    except Exception as e:
+                        print(f"{supervisor_name}: LLM error: {e}")
+                        # Fallback to first agent
+                        decision = {"next_node": managed_agents[0], "reasoning": "Fallback", "confidence": 0.5, "should_terminate": False}
+                
+                # iteration_count has an operator.add reducer, so write the increment only
                 update_data = {
-                    "iteration_count": state.get("iteration_count", 0) + 1,
+                    "iteration_count": 1,
                     "current_agent": decision["next_node"] if decision["next_node"] != "FINISH" else None,
                     "routing_decision": decision
                 }
                 
                 if decision.get("instructions"):
-                    update_data["messages"] = state.get("messages", []) + [HumanMessage(content=decision["instructions"], name="supervisor_instructions")]
+                    update_data["messages"] = [HumanMessage(content=decision["instructions"], name="supervisor_instructions")]
                     update_data["current_task"] = decision["instructions"]
                 
                 if decision.get("should_terminate", False) or decision["next_node"] == "FINISH":
                     update_data["team_status"] = "completed"
                     return Command(goto=END, update=update_data)
                 
+                # Fan out to independent agents in the same step
+                parallel_nodes = [
+                    node for node in dict.fromkeys(decision.get("parallel_nodes") or [])
+                    if node in managed_agents
+                ]
+                if len(parallel_nodes) > 1:
+                    update_data["current_agent"] = parallel_nodes[0]
+                    return Command(goto=parallel_nodes, update=update_data)
+                
                 return Command(goto=decision["next_node"], update=update_data)
                 
             except Exception as e:
@@ -855,7 +1051,7 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                 # Fallback to first agent
                 return Command(
                     goto=managed_agents[0] if managed_agents else END,
-                    update={"iteration_count": state.get("iteration_count", 0) + 1}
+                    update={"iteration_count": 1}
                 )
         
         return supervisor_node
@@ -866,7 +1062,7 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
             """Route based on human approval decision"""
             # Check if feedback was provided for this specific agent
             human_feedback = state.get("human_feedback")
-            pending_approval = state.get("pending_approval", {})
+            pending_approval = state.get("pending_approval") or {}
             
             # If feedback was provided and it's for the current agent, go back to agent for revision
             if human_feedback and pending_approval.get("agent") == agent_name:
@@ -881,14 +1077,13 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
         """Create node for human-in-the-loop approval"""
         async def human_approval_node(state: Dict[str, Any]) -> Command:
             """Handle human approval for agent actions"""
-            print("DEBUG: human_approval_node called!")
-            print(f"DEBUG: state keys: {list(state.keys())}")
-            print(f"DEBUG: pending_approval: {state.get('pending_approval')}")
+            pending_approval = state.get("pending_approval")
+            logger.debug("human_approval_node called, state keys: %s", state.keys())
+            logger.debug("pending_approval: %s", pending_approval)
             
             try:
-                pending_approval = state.get("pending_approval")
                 if not pending_approval:
-                    print("DEBUG: No pending_approval, returning to END")
+                    logger.debug("No pending_approval, returning to END")
                     # No pending approval, continue to END
                     return Command(goto=END, update={})
                 
@@ -896,11 +1091,11 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                 content = pending_approval.get("content", "")
                 tools = pending_approval.get("tools", [])
                 
-                # Record approval request in monitoring
+                # Record approval request in monitoring. Kept inline rather than
+                # deferred through _record: the monitor prints, and a deferred record
+                # would only run once the menu below is waiting for input
                 try:
-                    from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                    monitor = get_global_streaming_monitor()
-                    monitor.record_agent_interaction(
+                    self.monitor.record_agent_interaction(
                         "human_approval",
                         agent_name,
                         "approval_request",
@@ -911,39 +1106,21 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                         }
                     )
                 except Exception as e:
-                    print(f"Failed to record approval request: {e}")
+                    logger.debug("Failed to record approval request: %s", e)
                 
                 # Display approval request to user
-                print("\n" + "="*80)
-                print("🔔 HUMAN APPROVAL REQUIRED")
-                print("="*80)
-                print(f"Agent: {agent_name}")
-                print(f"Tools to execute: {tools}")
-                print(f"\nContent to publish:")
-                print("-"*40)
-                print(content[:500] + ("..." if len(content) > 500 else ""))
-                print("-"*40)
+                preview = content if len(content) <= 500 else content[:500] + "..."
+                print(
+                    f"\n{'=' * 80}\n🔔 HUMAN APPROVAL REQUIRED\n{'=' * 80}\n"
+                    f"Agent: {agent_name}\nTools to execute: {tools}\n"
+                    f"\nContent to publish:\n{'-' * 40}\n{preview}\n{'-' * 40}"
+                )
                 
                 # Get user decision
                 while True:
-                    print("\nOptions:")
-                    print("1. Approve - Execute the tools")
-                    print("2. Reject - Skip tool execution")
-                    print("3. View full content")
-                    print("4. Provide feedback - Give guidance to improve the content")
-                    print("\nEnter your choice (1/2/3/4): ", end="", flush=True)
-                     
-                    # Use asyncio to run input in executor since input() is blocking
-                    import sys
-                    if sys.version_info >= (3, 8):
-                        import asyncio
-                        loop = asyncio.get_event_loop()
-                        choice = await loop.run_in_executor(None, input)
-                    else:
-                        # Fallback for older Python versions
-                        choice = input()
+                    print(_APPROVAL_MENU, end="", flush=True)
                      
-                    choice = choice.strip()
+                    choice = (await self._read_input()).strip()
                      
                     if choice == "1":
                         decision = "approve"
@@ -966,12 +1143,7 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                         print("Type 'cancel' to go back to the main menu.")
                         
                         # Get feedback input
-                        if sys.version_info >= (3, 8):
-                            feedback = await loop.run_in_executor(None, input)
-                        else:
-                            feedback = input()
-                        
-                        feedback = feedback.strip()
+                        feedback = (await self._read_input()).strip()
                         
                         if feedback.lower() == 'cancel':
                             continue
@@ -998,47 +1170,29 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                         result = await self._handle_worker_tools(agent_name, content, worker_config.tools)
                         
                         # Record approval decision
-                        try:
-                            from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                            monitor = get_global_streaming_monitor()
-                            monitor.record_agent_interaction(
-                                "human_approval",
-                                agent_name,
-                                "approved",
-                                {"decision": "approved", "tools_executed": tools}
-                            )
-                            monitor.record_agent_output(agent_name, result)
-                        except Exception as e:
-                            print(f"Failed to record approval decision: {e}")
+                        self._record(
+                            "approval decision", self.monitor.record_agent_interaction,
+                            "human_approval",
+                            agent_name,
+                            "approved",
+                            {"decision": "approved", "tools_executed": tools}
+                        )
+                        self._record("approval decision", self.monitor.record_agent_output, agent_name, result)
                         
                         # Update state with tool execution result
                         update_data = {
-                            "messages": state.get("messages", []) + [
+                            "messages": [
                                 AIMessage(content=result, name=agent_name)
                             ],
                             "agent_results": {agent_name: result},
                             "pending_approval": None  # Clear pending approval
                         }
                         
-                        # Get next agent from execution plan (for orchestrated graph)
-                        execution_plan = state.get("execution_plan")
-                        if execution_plan:
-                            if isinstance(execution_plan, dict):
-                                from app.models.orchestration_state import ExecutionPlan
-                                execution_plan = ExecutionPlan(**execution_plan)
-                            
-                            execution_plan.mark_agent_complete(agent_name, result)
-                            next_agent = execution_plan.get_current_agent()
-                            if next_agent:
-                                update_data["execution_plan"] = execution_plan.dict()
-                                update_data["current_agent"] = next_agent
-                                return Command(goto=next_agent, update=update_data)
-                            else:
-                                # No next agent, go to result synthesis
-                                return Command(goto="result_synthesis", update=update_data)
-                        else:
-                            # Single agent graph, go to END
-                            return Command(goto=END, update=update_data)
+                        # Get next agent from execution plan (for orchestrated graph),
+                        # single agent graphs go to END
+                        return self._route_to_next_agent(
+                            state, agent_name, result, update_data, default_goto=END
+                        )
                     else:
                         # No tools to execute
                         execution_plan = state.get("execution_plan")
@@ -1054,7 +1208,7 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                     # Return to the agent with feedback for revision
                     # Store feedback in state and send back to agent
                     update_data = {
-                        "messages": state.get("messages", []) + [
+                        "messages": [
                             HumanMessage(content=f"HUMAN FEEDBACK: {feedback_data}\n\nPlease revise your work based on this feedback:", name="human_feedback")
                         ],
                         "agent_results": {agent_name: f"[FEEDBACK RECEIVED] {feedback_data}"},
@@ -1070,47 +1224,28 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                     print(f"\n❌ REJECTED: Tool execution skipped for {agent_name}")
                     
                     # Record rejection
-                    try:
-                        from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                        monitor = get_global_streaming_monitor()
-                        monitor.record_agent_interaction(
-                            "human_approval",
-                            agent_name,
-                            "rejected",
-                            {"decision": "rejected", "reason": "Human rejected the action"}
-                        )
-                    except Exception as e:
-                        print(f"Failed to record rejection: {e}")
+                    self._record(
+                        "rejection", self.monitor.record_agent_interaction,
+                        "human_approval",
+                        agent_name,
+                        "rejected",
+                        {"decision": "rejected", "reason": "Human rejected the action"}
+                    )
                     
                     # Update state with rejection
                     rejection_result = f"[REJECTED BY HUMAN] Tool execution was rejected for {agent_name}"
                     update_data = {
-                        "messages": state.get("messages", []) + [
+                        "messages": [
                             AIMessage(content=rejection_result, name=agent_name)
                         ],
                         "agent_results": {agent_name: rejection_result},
                         "pending_approval": None
                     }
                     
-                    # Get next agent
-                    execution_plan = state.get("execution_plan")
-                    if execution_plan:
-                        if isinstance(execution_plan, dict):
-                            from app.models.orchestration_state import ExecutionPlan
-                            execution_plan = ExecutionPlan(**execution_plan)
-                        
-                        execution_plan.mark_agent_complete(agent_name, rejection_result)
-                        next_agent = execution_plan.get_current_agent()
-                        if next_agent:
-                            update_data["execution_plan"] = execution_plan.dict()
-                            update_data["current_agent"] = next_agent
-                            return Command(goto=next_agent, update=update_data)
-                        else:
-                            # No next agent, go to result synthesis
-                            return Command(goto="result_synthesis", update=update_data)
-                    else:
-                        # Single agent graph, go to END
-                        return Command(goto=END, update=update_data)
+                    # Get next agent (single agent graphs go to END)
+                    return self._route_to_next_agent(
+                        state, agent_name, rejection_result, update_data, default_goto=END
+                    )
                 
                 else:
                     # Should not reach here
@@ -1123,7 +1258,7 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
             except Exception as e:
                 print(f"Human approval node failed: {e}")
                 # Clear pending approval and continue
-                execution_plan = state.get("execution_plan") if 'state' in locals() else None
+                execution_plan = state.get("execution_plan")
                 if execution_plan:
                     return Command(
                         goto="result_synthesis",
@@ -1153,25 +1288,22 @@ Output format: {{"next_node": "agent_name", "reasoning": "explanation", "confide
                 if not agent_results:
                     final_result = "No results were generated."
                 else:
-                    result_summary = "## Task Execution Results\n\n"
-                    for agent_name, result in agent_results.items():
-                        result_summary += f"### {agent_name}\n{result}\n\n"
-                    
-                    final_result = result_summary
+                    # Join once rather than growing the summary per agent
+                    final_result = "## Task Execution Results\n\n" + "".join(
+                        f"### {agent_name}\n{result}\n\n"
+                        for agent_name, result in agent_results.items()
+                    )
                 
                 # Record final result in monitoring
-                try:
-                    from app.monitoring.streaming_monitor import get_global_streaming_monitor
-                    monitor = get_global_streaming_monitor()
-                    monitor.record_agent_output("result_synthesis", f"Synthesized results from {len(agent_results)} agents")
-                    monitor.record_agent_interaction(
-                        "result_synthesis",
-                        "END",
-                        "complete",
-                        {"agents_executed": len(agent_results)}
-                    )
-                except Exception as e:
-                    print(f"Failed to record result synthesis: {e}")
+                if self.monitor.output_logging_enabled:
+                    self._record("result synthesis", self.monitor.record_agent_output, "result_synthesis", f"Synthesized results from {len(agent_results)} agents")
+                self._record(
+                    "result synthesis", self.monitor.record_agent_interaction,
+                    "result_synthesis",
+                    "END",
+                    "complete",
+                    {"agents_executed": len(agent_results)}
+                )
                 
                 return Command(
                     goto=END,
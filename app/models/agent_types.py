@@ -1,8 +1,14 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
+import hashlib
 import os
 from langchain_openai import ChatOpenAI
 
+# Default per-request HTTP timeout in seconds, enforced by the client itself
+REQUEST_TIMEOUT = 30.0
+# Default number of client retries on timeouts and transient API errors
+MAX_RETRIES = 2
+
 @dataclass
 class AgentConfig:
     """Configuration for a single agent"""
@@ -16,13 +22,21 @@ class AgentConfig:
     tool_names: Optional[List[str]] = None # List of tool names from config
     system_prompt: str = ""
     managed_agents: Optional[List[str]] = None
-    depends_on: Optional[List[str]] = None  # List of agent names this agent depends on
+    depends_on: List[str] = field(default_factory=list)  # List of agent names this agent depends on
     output_schema: Optional[str] = None
     require_approval: bool = False
+    cache_responses: bool = False  # Reuse LLM responses for repeated tasks; only for deterministic output
+    request_timeout: float = REQUEST_TIMEOUT
+    max_retries: int = MAX_RETRIES
+    _model: Any = field(default=None, init=False, repr=False, compare=False)
 
     def get_model(self):
-        """Create and return the configured LLM model"""
-        headers = self.headers or {}
+        """Return the configured LLM model, created once and reused across calls"""
+        # Reusing the instance keeps its HTTP client and connection pool alive
+        if self._model is not None:
+            return self._model
+        
+        headers = dict(self.headers or {})
         
         # Add Authorization header if API key is available
         api_key = os.getenv(self.api_key_env_var)
@@ -33,10 +47,22 @@ class AgentConfig:
             model=self.model_name,
             api_key=api_key,
             base_url=self.base_url,
-            default_headers=headers
+            default_headers=headers,
+            timeout=self.request_timeout,
+            max_retries=self.max_retries
         )
+        self._model = llm
         return llm
 
+    def get_prompt_cache_kwargs(self) -> Dict[str, Any]:
+        """Invocation kwargs that route calls sharing this system prompt to the same provider cache"""
+        # prompt_cache_key is an OpenAI parameter; other OpenAI-compatible
+        # providers (no default base_url) may reject it
+        if self.base_url or not self.system_prompt:
+            return {}
+        prompt_hash = hashlib.sha1(self.system_prompt.encode("utf-8")).hexdigest()[:16]
+        return {"prompt_cache_key": f"{self.name}:{prompt_hash}"}
+
 class AgentConfigManager:
     """Manages configuration for all agents"""
 
@@ -3,9 +3,9 @@
 Orchestration state models for dynamic graph building with dependency resolution.
 """
 
-from typing import TypedDict, Optional, Dict, Any, List, Annotated
+from typing import TypedDict, Optional, Dict, Any, List, Annotated, Tuple
 from langgraph.graph import MessagesState
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 import operator
 
@@ -20,6 +20,9 @@ class ExecutionPlan(BaseModel):
     completed_steps: List[str] = Field(description="Completed steps", default_factory=list)
     agent_results: Dict[str, str] = Field(description="Results from each agent", default_factory=dict)
     
+    # Subtask dependencies by assigned agent; subtasks are fixed once the plan is made
+    _deps_by_agent: Optional[Dict[str, List[str]]] = PrivateAttr(default=None)
+    
     def get_current_agent(self) -> Optional[str]:
         """Get the current agent to execute"""
         if self.current_step < len(self.execution_order):
@@ -48,13 +51,15 @@ class ExecutionPlan(BaseModel):
     
     def get_pending_dependencies(self, agent_name: str) -> List[str]:
         """Get pending dependencies for an agent"""
-        pending = []
-        for subtask in self.subtasks:
-            if subtask.get("assigned_to") == agent_name:
-                for dep in subtask.get("dependencies", []):
-                    if dep not in self.completed_steps:
-                        pending.append(dep)
-        return pending
+        if self._deps_by_agent is None:
+            deps_by_agent = {}
+            for subtask in self.subtasks:
+                deps_by_agent.setdefault(subtask.get("assigned_to"), []).extend(subtask.get("dependencies", []))
+            self._deps_by_agent = deps_by_agent
+        
+        # completed_steps is replaced wholesale by the reducer, so take the set per call
+        completed = set(self.completed_steps)
+        return [dep for dep in self._deps_by_agent.get(agent_name, ()) if dep not in completed]
     
     def can_execute(self, agent_name: str) -> bool:
         """Check if an agent can execute (all dependencies satisfied)"""
@@ -71,17 +76,25 @@ class OrchestrationState(MessagesState):
         if not right:
             return left
         
-        # Helper to ensure we have objects
-        left_plan = left if isinstance(left, ExecutionPlan) else ExecutionPlan(**left)
-        right_plan = right if isinstance(right, ExecutionPlan) else ExecutionPlan(**right)
+        # Helper to ensure we have objects; plans in state are already valid, so skip validation
+        left_plan = left if isinstance(left, ExecutionPlan) else ExecutionPlan.model_construct(**left)
+        right_plan = right if isinstance(right, ExecutionPlan) else ExecutionPlan.model_construct(**right)
             
-        # Merge completed_steps (union)
-        all_completed = list(set(left_plan.completed_steps + right_plan.completed_steps))
+        # Merge completed_steps (union, in completion order)
+        all_completed = list(dict.fromkeys(left_plan.completed_steps + right_plan.completed_steps))
         
-        # Use right (newest) plan as base but ensure we keep all completions
-        merged_plan = right_plan.model_copy(deep=True)
+        # Use right (newest) plan as base but ensure we keep all completions. A shallow
+        # copy suffices: the containers mark_agent_complete mutates are replaced below
+        merged_plan = right_plan.model_copy()
         merged_plan.completed_steps = all_completed
         
+        # Agents in the same dependency level complete concurrently, each advancing
+        # its own copy of the plan, so recompute the step from the merged completions
+        merged_plan.current_step = next(
+            (i for i, agent in enumerate(merged_plan.execution_order) if agent not in all_completed),
+            len(merged_plan.execution_order)
+        )
+        
         # Also ensure agent_results are merged if right didn't have them all
         merged_results = {**left_plan.agent_results, **right_plan.agent_results}
         merged_plan.agent_results = merged_results
@@ -146,7 +159,8 @@ class OrchestrationState(MessagesState):
     max_iterations: int = Field(description="Maximum iterations allowed", default=20)
     
     # Performance metrics
-    start_time: Optional[datetime] = Field(description="Workflow start time", default=None)
+    start_time_ns: Optional[int] = Field(description="Workflow start as a time.perf_counter_ns() reading", default=None)
+    deadline: Optional[float] = Field(description="Wall-clock time.time() by which the workflow must finish", default=None)
     total_agent_calls: Annotated[int, operator.add] = Field(description="Total agent calls", default=0)
     total_tool_calls: Annotated[int, operator.add] = Field(description="Total tool calls", default=0)
     
@@ -199,13 +213,9 @@ class OrchestrationState(MessagesState):
         """Convert to dictionary for serialization"""
         data = dict(self)
         
-        # Handle datetime serialization
-        if data.get("start_time"):
-            data["start_time"] = data["start_time"].isoformat()
-        
         # Handle execution plan serialization
         if data.get("execution_plan"):
-            data["execution_plan"] = self.execution_plan.dict()
+            data["execution_plan"] = self.execution_plan.model_dump()
         
         return data
 
@@ -222,46 +232,44 @@ class DependencyGraph:
         """
         self.agents = agents_config
         self.graph = self._build_dependency_graph()
+        # Agent configs are fixed for the graph's lifetime, so derived results are cached
+        self._topological_order: Optional[List[str]] = None
+        self._subgraph_cache: Dict[str, Dict[str, List[str]]] = {}
     
     def _build_dependency_graph(self) -> Dict[str, List[str]]:
         """Build adjacency list of dependencies"""
         graph = {}
         for agent_name, config in self.agents.items():
-            depends_on = getattr(config, 'depends_on', []) or []
-            graph[agent_name] = depends_on
+            graph[agent_name] = config.depends_on
         return graph
     
-    def get_topological_order(self) -> List[str]:
-        """Get topological order of agents based on dependencies"""
-        from collections import deque
-        
-        # Build reverse adjacency list: who depends on me?
+    def _build_reverse_graph(self) -> Tuple[Dict[str, List[str]], Dict[str, int]]:
+        """Build who-depends-on-me adjacency and in-degrees in one pass over the edges"""
         reverse_graph = {agent: [] for agent in self.graph}
-        for agent, deps in self.graph.items():
-            for dep in deps:
-                if dep in reverse_graph:
-                    reverse_graph[dep].append(agent)
-                else:
-                    reverse_graph[dep] = [agent]
-        
-        # Calculate in-degrees (number of dependencies for each agent)
-        in_degree = {agent: 0 for agent in self.graph}
+        in_degree = {}
         for agent, deps in self.graph.items():
             in_degree[agent] = len(deps)
+            for dep in deps:
+                reverse_graph.setdefault(dep, []).append(agent)
+        return reverse_graph, in_degree
+    
+    def get_topological_order(self) -> List[str]:
+        """Get topological order of agents based on dependencies"""
+        # The graph is fixed once built, so sort it only once
+        if self._topological_order is not None:
+            return list(self._topological_order)
         
-        # Initialize queue with agents having no dependencies
-        queue = deque([agent for agent, deg in in_degree.items() if deg == 0])
-        result = []
+        reverse_graph, in_degree = self._build_reverse_graph()
         
-        while queue:
-            agent = queue.popleft()
-            result.append(agent)
-            
+        # Kahn's algorithm over a list used as a FIFO queue: agents are appended
+        # as they become ready and read back in the same order
+        result = [agent for agent, deg in in_degree.items() if deg == 0]
+        for agent in result:
             # Reduce in-degree of neighbors that depend on this agent
-            for neighbor in reverse_graph.get(agent, []):
+            for neighbor in reverse_graph[agent]:
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+                    result.append(neighbor)
         
         # Check for cycles
         if len(result) != len(self.graph):
@@ -269,7 +277,33 @@ class DependencyGraph:
             # or provide a deterministic order
             raise ValueError(f"Cycle detected in dependency graph. Could only order {len(result)} of {len(self.graph)} agents.")
         
-        return result
+        self._topological_order = result
+        return list(result)
+
+    def get_level_sets(self) -> List[List[str]]:
+        """Group agents into levels whose dependencies are all in earlier levels"""
+        reverse_graph, in_degree = self._build_reverse_graph()
+        
+        # Kahn's algorithm, taking every zero in-degree agent per round
+        level = [agent for agent, deg in in_degree.items() if deg == 0]
+        levels = []
+        ordered = 0
+        
+        while level:
+            levels.append(level)
+            ordered += len(level)
+            next_level = []
+            for agent in level:
+                for neighbor in reverse_graph.get(agent, []):
+                    in_degree[neighbor] -= 1
+                    if in_degree[neighbor] == 0:
+                        next_level.append(neighbor)
+            level = next_level
+        
+        if ordered != len(self.graph):
+            raise ValueError(f"Cycle detected in dependency graph. Could only order {ordered} of {len(self.graph)} agents.")
+        
+        return levels
     
     def _get_hierarchy_order(self) -> List[str]:
         """Fallback order based on agent hierarchy (supervisors first)"""
@@ -295,23 +329,25 @@ class DependencyGraph:
     
     def get_agent_subgraph(self, start_agent: str) -> Dict[str, List[str]]:
         """Get subgraph starting from a specific agent (including managed agents)"""
-        visited = set()
-        subgraph = {}
-        
-        def dfs(agent: str):
-            if agent in visited:
-                return
-            visited.add(agent)
-            
-            # Get dependencies
-            deps = self.graph.get(agent, [])
-            subgraph[agent] = deps
+        cached = self._subgraph_cache.get(start_agent)
+        if cached is None:
+            # Iterative depth-first walk; managed agents are pushed in reverse
+            # so they are visited in config order
+            subgraph = {}
+            stack = [start_agent]
+            while stack:
+                agent = stack.pop()
+                if agent in subgraph:
+                    continue
+                
+                # Get dependencies
+                subgraph[agent] = self.graph.get(agent, [])
+                
+                # Get managed agents (if any)
+                config = self.agents.get(agent)
+                managed_agents = getattr(config, 'managed_agents', None)
+                if managed_agents:
+                    stack.extend(reversed(managed_agents))
             
-            # Get managed agents (if any)
-            config = self.agents.get(agent)
-            if config and hasattr(config, 'managed_agents') and config.managed_agents:
-                for managed in config.managed_agents:
-                    dfs(managed)
-        
-        dfs(start_agent)
-        return subgraph
\ No newline at end of file
+            cached = self._subgraph_cache[start_agent] = subgraph
+        return dict(cached)
\ No newline at end of file
@@ -134,11 +134,13 @@ class EnhancedMarketingState(MessagesState):
                 }
                 
                 # Add optional fields
-                if hasattr(msg, 'name') and msg.name:
-                    msg_dict['name'] = msg.name
+                name = getattr(msg, 'name', None)
+                if name:
+                    msg_dict['name'] = name
                 
-                if hasattr(msg, 'additional_kwargs') and msg.additional_kwargs:
-                    msg_dict['additional_kwargs'] = msg.additional_kwargs
+                additional_kwargs = getattr(msg, 'additional_kwargs', None)
+                if additional_kwargs:
+                    msg_dict['additional_kwargs'] = additional_kwargs
                 
                 data['messages'].append(msg_dict)
         
@@ -5,7 +5,9 @@ Tracks agent performance, errors, and provides metrics.
 """
 
 import asyncio
+import itertools
 import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
@@ -31,7 +33,7 @@ class TaskType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     """Agent event data"""
     timestamp: datetime
@@ -100,7 +102,8 @@ class BasicMonitor:
     """Basic monitoring system for agents"""
     
     def __init__(self, max_events: int = 1000):
-        self.events: List[AgentEvent] = []
+        # Bounded ring buffer: the oldest events drop off once max_events is reached
+        self.events: deque[AgentEvent] = deque(maxlen=max_events)
         self.metrics: Dict[str, AgentMetrics] = {}
         self.max_events = max_events
         self.start_time = datetime.now()
@@ -123,10 +126,6 @@ class BasicMonitor:
         
         self.events.append(event)
         
-        # Trim events if exceeding max
-        if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events:]
-        
         # Update metrics
         if agent_name not in self.metrics:
             self.metrics[agent_name] = AgentMetrics(agent_name=agent_name)
@@ -204,7 +203,12 @@ class BasicMonitor:
     
     def get_recent_events(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent events"""
-        recent = self.events[-limit:] if self.events else []
+        if limit <= 0:
+            # Slice semantics as before: a zero limit returns every event
+            recent = list(self.events)[-limit:]
+        else:
+            # Walk back from the newest event so only `limit` events are copied
+            recent = list(itertools.islice(reversed(self.events), limit))[::-1]
         return [event.to_dict() for event in recent]
     
     def get_events_by_agent(self, agent_name: str, limit: int = 20) -> List[Dict[str, Any]]:
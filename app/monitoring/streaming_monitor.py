@@ -5,7 +5,9 @@ Provides live visualization of agent activities, conversations, and outputs.
 """
 
 import asyncio
+import itertools
 import time
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
@@ -14,12 +16,15 @@ import json
 
 from app.monitoring.basic_monitor import BasicMonitor, AgentEvent, TimerContext
 
+# Separator line for console banners
+_RULE = "=" * 60
+
 
 class EventStream:
     """Real-time event stream for monitoring agent activities"""
     
     def __init__(self, max_buffer: int = 1000):
-        self.events: List[Dict[str, Any]] = []
+        self.events: deque[Dict[str, Any]] = deque(maxlen=max_buffer)
         self.max_buffer = max_buffer
         self.subscribers: List[Callable[[Dict[str, Any]], None]] = []
         self.workflow_graph: List[Dict[str, Any]] = []  # Tracks agent interactions
@@ -28,10 +33,6 @@ class EventStream:
         """Add event to stream and notify subscribers"""
         self.events.append(event)
         
-        # Trim buffer if needed
-        if len(self.events) > self.max_buffer:
-            self.events = self.events[-self.max_buffer:]
-        
         # Notify subscribers
         for subscriber in self.subscribers:
             try:
@@ -79,12 +80,9 @@ class EventStream:
         
         self.add_event(output_event)
         
-        # Print to console
-        print(f"\n{'='*60}")
-        print(f"AGENT OUTPUT: {agent_name}")
-        print(f"{'='*60}")
-        print(f"{output[:300]}..." if len(output) > 300 else output)
-        print(f"{'='*60}\n")
+        # Print to console as one write so concurrent agents don't interleave lines
+        body = f"{output[:300]}..." if len(output) > 300 else output
+        print(f"\n{_RULE}\nAGENT OUTPUT: {agent_name}\n{_RULE}\n{body}\n{_RULE}\n")
     
     def record_routing_decision(self, supervisor: str, decision: Dict[str, Any], reasoning: str):
         """Record routing decision"""
@@ -98,18 +96,21 @@ class EventStream:
         
         self.add_event(routing_event)
         
-        # Print to console
-        print(f"\n{'='*60}")
-        print(f"ROUTING DECISION: {supervisor}")
-        print(f"{'='*60}")
-        print(f"Next: {decision.get('next_node', 'unknown')}")
-        print(f"Confidence: {decision.get('confidence', 0):.2f}")
-        print(f"Reasoning: {reasoning[:200]}...")
-        print(f"{'='*60}\n")
+        # Print to console as one write
+        print(
+            f"\n{_RULE}\nROUTING DECISION: {supervisor}\n{_RULE}\n"
+            f"Next: {decision.get('next_node', 'unknown')}\n"
+            f"Confidence: {decision.get('confidence', 0):.2f}\n"
+            f"Reasoning: {reasoning[:200]}...\n{_RULE}\n"
+        )
     
     def get_recent_events(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent events"""
-        return self.events[-limit:] if self.events else []
+        if limit <= 0:
+            # Slice semantics as before: a zero limit returns every event
+            return list(self.events)[-limit:]
+        # Walk back from the newest event so only `limit` events are copied
+        return list(itertools.islice(reversed(self.events), limit))[::-1]
     
     def get_workflow_graph(self) -> List[Dict[str, Any]]:
         """Get workflow graph (agent interactions)"""
@@ -161,10 +162,15 @@ class EventStream:
 class StreamingMonitor(BasicMonitor):
     """Enhanced monitor with real-time streaming capabilities"""
     
-    def __init__(self, max_events: int = 1000):
+    def __init__(self, max_events: int = 1000,
+                 prompt_logging_enabled: bool = True,
+                 output_logging_enabled: bool = True):
         super().__init__(max_events)
         self.stream = EventStream(max_buffer=500)
         self.agent_outputs: Dict[str, List[str]] = {}
+        # Callers check these before building prompt/output payloads
+        self.prompt_logging_enabled = prompt_logging_enabled
+        self.output_logging_enabled = output_logging_enabled
     
     def record_event(self, 
                     agent_name: str, 
@@ -217,12 +223,9 @@ class StreamingMonitor(BasicMonitor):
         }
         self.stream.add_event(prompt_event)
         
-        # Print to console
-        print(f"\n{'='*60}")
-        print(f"AGENT PROMPT: {agent_name}")
-        print(f"{'='*60}")
-        print(prompt[:500] + ("..." if len(prompt) > 500 else ""))
-        print(f"{'='*60}\n")
+        # Print to console as one write
+        body = prompt[:500] + ("..." if len(prompt) > 500 else "")
+        print(f"\n{_RULE}\nAGENT PROMPT: {agent_name}\n{_RULE}\n{body}\n{_RULE}\n")
 
     
     def get_stream(self) -> EventStream:
@@ -26,6 +26,10 @@ from app.models.state_models import (
 
 T = TypeVar('T', bound=RoutingDecision)
 
+# Fallback routing keywords, compiled once so each check is a single case-insensitive scan
+_RESEARCH_KEYWORDS_RE = re.compile(r"research|analyze|data|market|trend|competitor|study|investigate", re.I)
+_CONTENT_KEYWORDS_RE = re.compile(r"content|write|blog|article|create|draft|post|seo|optimize", re.I)
+
 
 class JSONOutputValidator:
     """Validate and sanitize JSON outputs from LLMs"""
@@ -99,6 +103,10 @@ class StructuredRouter:
         # JSON validator
         self.validator = JSONOutputValidator()
         
+        # Nodes and format instructions are fixed per router, so build the prompt text once
+        self._available_nodes_text = ', '.join(available_nodes)
+        self.system_prompt = self._create_system_prompt()
+        
         # Statistics
         self.call_count = 0
         self.success_count = 0
@@ -110,7 +118,7 @@ class StructuredRouter:
         
         return f"""You are a routing supervisor for a hierarchical marketing agent system.
 
-Available nodes to route to: {', '.join(self.available_nodes)}
+Available nodes to route to: {self._available_nodes_text}
 
 Your task is to analyze the CURRENT STATE and decide which node should handle it next.
 You MUST also provide specific, actionable INSTRUCTIONS for that node.
@@ -167,32 +175,7 @@ Example output for complex task "Promote my GitHub repository" AFTER research:
         """Route based on current state"""
         self.call_count += 1
         
-        # Extract task description and analyze what's been done
-        messages = state.get("messages", [])
-        if messages:
-            # Get the last human message (original task)
-            human_messages = [
-                msg for msg in messages
-                if hasattr(msg, 'type') and msg.type == 'human'
-            ]
-            if human_messages:
-                task_description = human_messages[-1].content
-            else:
-                task_description = messages[-1].content
-        else:
-            task_description = state.get("task", "")
-        
-        # Analyze what agents have already worked on the task
-        agents_worked = []
-        for msg in messages:
-            if hasattr(msg, 'name') and msg.name:
-                agents_worked.append(msg.name)
-        
-        # Get unique agents
-        unique_agents = list(set(agents_worked))
-        work_summary = f"Agents that have worked on this task: {', '.join(unique_agents) if unique_agents else 'None'}"
-        
-        # Check iteration limit
+        # Check iteration limit before scanning the message history
         iteration_count = state.get("iteration_count", 0)
         if iteration_count >= self.max_iterations:
             return self.decision_model(
@@ -202,24 +185,32 @@ Example output for complex task "Promote my GitHub repository" AFTER research:
                 should_terminate=True
             )
         
+        # Extract task description and analyze what's been done
+        messages = state.get("messages", [])
+        if messages:
+            # Get the last human message (original task), scanning from the end
+            last_human = next(
+                (msg for msg in reversed(messages) if getattr(msg, 'type', None) == 'human'),
+                None
+            )
+            task_description = (last_human or messages[-1]).content
+        else:
+            task_description = state.get("task", "")
+        
+        # Analyze what agents have already worked on the task
+        unique_agents = list({name for msg in messages if (name := getattr(msg, 'name', None))})
+        work_summary = f"Agents that have worked on this task: {', '.join(unique_agents) if unique_agents else 'None'}"
+        
         try:
             # Get LLM response with context about what's been done
-            context = {
-                "task_description": task_description,
-                "work_summary": work_summary,
-                "iteration_count": iteration_count,
-                "available_nodes": ', '.join(self.available_nodes)
-            }
-            
-            # Create a more detailed prompt
             detailed_prompt = ChatPromptTemplate.from_messages([
-                SystemMessage(content=self._create_system_prompt()),
+                SystemMessage(content=self.system_prompt),
                 HumanMessage(content=f"""Task: {task_description}
 
 Current State:
 - {work_summary}
 - Iteration: {iteration_count + 1} of {self.max_iterations}
-- Available next steps: {', '.join(self.available_nodes)}
+- Available next steps: {self._available_nodes_text}
 
 Based on what's been done so far, what should happen next?""")
             ])
@@ -267,22 +258,17 @@ Based on what's been done so far, what should happen next?""")
     
     def _fallback_routing(self, task_description: str, error: Exception) -> T:
         """Fallback routing when LLM fails"""
-        task_lower = task_description.lower()
-        
         # Simple keyword matching
         next_node = "FINISH"  # Default to finish
         
         # Check for keywords to determine routing
-        research_keywords = ['research', 'analyze', 'data', 'market', 'trend', 'competitor', 'study', 'investigate']
-        content_keywords = ['content', 'write', 'blog', 'article', 'create', 'draft', 'post', 'seo', 'optimize']
-        
-        if any(keyword in task_lower for keyword in research_keywords):
+        if _RESEARCH_KEYWORDS_RE.search(task_description):
             # Route to research_team if available, otherwise first available node
             if "research_team" in self.available_nodes:
                 next_node = "research_team"
             else:
                 next_node = self.available_nodes[0] if self.available_nodes else "FINISH"
-        elif any(keyword in task_lower for keyword in content_keywords):
+        elif _CONTENT_KEYWORDS_RE.search(task_description):
             # Route to content_team if available, otherwise first available node
             if "content_team" in self.available_nodes:
                 next_node = "content_team"
@@ -3,6 +3,8 @@
 LinkedIn posting tool implementation.
 """
 
+import asyncio
+import logging
 import os
 import requests
 import json
@@ -12,6 +14,8 @@ from datetime import datetime
 from app.tools.tool_registry import BaseTool, ToolMetadata
 from app.models.state_models import APIError
 
+logger = logging.getLogger(__name__)
+
 class LinkedInPostTool(BaseTool):
     """Tool for posting content to LinkedIn personal profile or company page"""
     
@@ -32,7 +36,7 @@ class LinkedInPostTool(BaseTool):
     
     async def execute(self, content: str, **kwargs) -> str:
         """Execute the LinkedIn post"""
-        print(f"DEBUG LinkedInPostTool.execute: Starting, content length: {len(content)}")
+        logger.debug("LinkedInPostTool.execute: Starting, content length: %d", len(content))
         self.call_count += 1
         start_time = datetime.now()
         
@@ -40,16 +44,16 @@ class LinkedInPostTool(BaseTool):
         target_urn = kwargs.get('company_urn') or self.company_urn
         is_company_post = bool(target_urn)
         
-        print(f"DEBUG LinkedInPostTool: target_urn={target_urn}, is_company_post={is_company_post}")
-        print(f"DEBUG LinkedInPostTool: access_token set: {bool(self.access_token)}")
-        print(f"DEBUG LinkedInPostTool: company_urn set: {bool(self.company_urn)}")
-        print(f"DEBUG LinkedInPostTool: user_urn set: {bool(self.user_urn)}")
+        logger.debug("LinkedInPostTool: target_urn=%s, is_company_post=%s", target_urn, is_company_post)
+        logger.debug("LinkedInPostTool: access_token set: %s", bool(self.access_token))
+        logger.debug("LinkedInPostTool: company_urn set: %s", bool(self.company_urn))
+        logger.debug("LinkedInPostTool: user_urn set: %s", bool(self.user_urn))
         
         # Validation
         if not self.access_token:
             self.error_count += 1
             error_msg = "Missing LinkedIn credentials (LINKEDIN_ACCESS_TOKEN)"
-            print(f"DEBUG LinkedInPostTool: {error_msg}")
+            logger.debug("LinkedInPostTool: %s", error_msg)
             raise APIError(
                 message=error_msg,
                 component="LinkedInPostTool",
@@ -61,7 +65,7 @@ class LinkedInPostTool(BaseTool):
         if is_company_post and not target_urn:
             self.error_count += 1
             error_msg = "Missing LinkedIn company URN for company posting"
-            print(f"DEBUG LinkedInPostTool: {error_msg}")
+            logger.debug("LinkedInPostTool: %s", error_msg)
             raise APIError(
                 message=error_msg,
                 component="LinkedInPostTool",
@@ -73,7 +77,7 @@ class LinkedInPostTool(BaseTool):
         if not is_company_post and not self.user_urn:
             self.error_count += 1
             error_msg = "Missing LinkedIn user URN for personal posting"
-            print(f"DEBUG LinkedInPostTool: {error_msg}")
+            logger.debug("LinkedInPostTool: %s", error_msg)
             raise APIError(
                 message=error_msg,
                 component="LinkedInPostTool",
@@ -92,7 +96,7 @@ class LinkedInPostTool(BaseTool):
             
             # Use company URN if available, otherwise use personal user URN
             author_urn = target_urn if is_company_post else self.user_urn
-            print(f"DEBUG LinkedInPostTool: author_urn={author_urn}")
+            logger.debug("LinkedInPostTool: author_urn=%s", author_urn)
             
             payload = {
                 "author": author_urn,
@@ -110,12 +114,15 @@ class LinkedInPostTool(BaseTool):
                 }
             }
             
-            print(f"DEBUG LinkedInPostTool: Making POST request to {post_url}")
-            print(f"DEBUG LinkedInPostTool: Payload author: {payload['author']}")
-            # Synchronous request in async method (should ideally be async, but okay for low volume)
-            response = requests.post(post_url, headers=headers, json=payload, timeout=30)
-            print(f"DEBUG LinkedInPostTool: Response status: {response.status_code}")
-            print(f"DEBUG LinkedInPostTool: Response text: {response.text[:500]}")
+            logger.debug("LinkedInPostTool: Making POST request to %s", post_url)
+            logger.debug("LinkedInPostTool: Payload author: %s", payload['author'])
+            # requests is blocking, so run it in a worker thread to keep the event loop free
+            # for other agents while LinkedIn responds
+            response = await asyncio.to_thread(
+                requests.post, post_url, headers=headers, json=payload, timeout=30
+            )
+            logger.debug("LinkedInPostTool: Response status: %s", response.status_code)
+            logger.debug("LinkedInPostTool: Response text: %.500s", response.text)
             
             duration = (datetime.now() - start_time).total_seconds() * 1000
             self.total_duration += duration
@@ -125,12 +132,12 @@ class LinkedInPostTool(BaseTool):
                 feed_url = f"https://www.linkedin.com/feed/update/{post_id}"
                 post_type = "company page" if is_company_post else "personal profile"
                 result = f"✅ Successfully published to LinkedIn {post_type}! View post: {feed_url}"
-                print(f"DEBUG LinkedInPostTool: Success: {result}")
+                logger.debug("LinkedInPostTool: Success: %s", result)
                 return result
             else:
                 self.error_count += 1
                 error_msg = f"LinkedIn API Error: {response.status_code} - {response.text}"
-                print(f"DEBUG LinkedInPostTool: {error_msg}")
+                logger.debug("LinkedInPostTool: %s", error_msg)
                 
                 # Provide more helpful error message for common issues
                 if response.status_code == 403:
@@ -152,7 +159,7 @@ class LinkedInPostTool(BaseTool):
                 
         except Exception as e:
             self.error_count += 1
-            print(f"DEBUG LinkedInPostTool: Exception: {e}")
+            logger.debug("LinkedInPostTool: Exception: %s", e)
             if isinstance(e, APIError):
                 raise e
             raise APIError(
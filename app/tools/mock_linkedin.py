@@ -3,12 +3,15 @@ Mock LinkedIn posting tool for testing without actual LinkedIn API credentials.
 This tool simulates the LinkedIn posting process and can be used for development and testing.
 """
 import asyncio
+import logging
 import random
 from datetime import datetime
 from typing import Optional
 from app.tools.tool_registry import BaseTool, ToolMetadata
 from app.models.state_models import APIError
 
+logger = logging.getLogger(__name__)
+
 
 class MockLinkedInPostTool(BaseTool):
     """Mock LinkedIn posting tool for testing."""
@@ -37,13 +40,13 @@ class MockLinkedInPostTool(BaseTool):
         Returns:
             Success message with mock post ID
         """
-        print(f"DEBUG MockLinkedInPostTool: Starting mock LinkedIn post")
-        print(f"DEBUG MockLinkedInPostTool: Content length: {len(content)}")
+        logger.debug("MockLinkedInPostTool: Starting mock LinkedIn post")
+        logger.debug("MockLinkedInPostTool: Content length: %d", len(content))
         
         # Determine posting target (company or personal)
         target_urn = kwargs.get('company_urn', "urn:li:organization:110163013")
         is_company_post = bool(target_urn)
-        print(f"DEBUG MockLinkedInPostTool: target_urn={target_urn}, is_company_post={is_company_post}")
+        logger.debug("MockLinkedInPostTool: target_urn=%s, is_company_post=%s", target_urn, is_company_post)
         
         # Simulate API call delay
         await asyncio.sleep(random.uniform(0.5, 2.0))
@@ -51,7 +54,7 @@ class MockLinkedInPostTool(BaseTool):
         # Randomly fail to test error handling
         if random.random() > self.success_rate:
             error_msg = "Mock LinkedIn API Error: 403 - ACCESS_DENIED (simulated error for testing)"
-            print(f"DEBUG MockLinkedInPostTool: Simulating API error: {error_msg}")
+            logger.debug("MockLinkedInPostTool: Simulating API error: %s", error_msg)
             raise APIError(
                 message=error_msg,
                 component="MockLinkedInPostTool",
@@ -70,7 +73,7 @@ class MockLinkedInPostTool(BaseTool):
         result += f"\n\nContent preview: {content[:100]}..."
         result += f"\n\nNote: This is a mock post. No actual LinkedIn API call was made."
         
-        print(f"DEBUG MockLinkedInPostTool: Mock success: {result}")
+        logger.debug("MockLinkedInPostTool: Mock success: %s", result)
         return result
 
 
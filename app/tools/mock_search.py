@@ -3,6 +3,7 @@
 Mock search tool for testing when real API keys are not available.
 """
 
+import asyncio
 import random
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
@@ -165,7 +166,6 @@ class MockSearchTool(BaseTool):
     
     async def _simulate_delay(self, min_ms: int = 100, max_ms: int = 500):
         """Simulate network delay"""
-        import asyncio
         delay_ms = random.randint(min_ms, max_ms)
         await asyncio.sleep(delay_ms / 1000.0)
     
@@ -183,8 +183,6 @@ class MockSearchTool(BaseTool):
             )
             tasks.append(task)
         
-        # Import here to avoid circular imports
-        import asyncio
         results = await asyncio.gather(*tasks)
         
         combined_answer = " ".join([r.get("answer", "") for r in results])
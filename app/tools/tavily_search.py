@@ -34,6 +34,34 @@ class TavilySearchTool(BaseTool):
         # Cache for search results (simple in-memory cache)
         self.cache: Dict[str, Dict[str, Any]] = {}
         self.cache_ttl = 3600  # 1 hour in seconds
+        
+        # Shared HTTP session so searches reuse keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it for the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # A session is bound to the loop that created it, so close the stale one
+            await self.close()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=32)
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            try:
+                await self._session.close()
+            except RuntimeError:
+                # Its event loop is already closed; the session is still marked closed
+                pass
+        self._session = None
+        self._session_loop = None
     
     async def execute(
         self, 
@@ -93,94 +121,62 @@ class TavilySearchTool(BaseTool):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/search",
-                    json=payload,
-                    headers=headers,
-                    timeout=30
-                ) as response:
-                    # Get response text first to handle both JSON and text responses
-                    response_text = await response.text()
-                    
-                    if response.status == 200:
-                        try:
-                            # Try to parse as JSON
-                            data = json.loads(response_text)
-                            
-                            # Validate that data is a dictionary
-                            if not isinstance(data, dict):
-                                self.error_count += 1
-                                raise APIError(
-                                    message=f"Tavily API returned non-dict response: {type(data)}",
-                                    component="TavilySearchTool",
-                                    operation="execute",
-                                    context={
-                                        "query": query,
-                                        "status_code": response.status,
-                                        "response_type": str(type(data)),
-                                        "response_preview": str(data)[:200]
-                                    },
-                                    suggested_action="Check Tavily API documentation or contact support",
-                                    retryable=True
-                                )
-                            
-                            # Calculate cost and duration
-                            duration = (datetime.now() - start_time).total_seconds() * 1000
-                            self.total_duration += duration
-                            self.total_cost += self.metadata.cost_per_call
-                            
-                            # Format results
-                            result = self._format_results(data, query)
-                            
-                            # Cache the result
-                            self.cache[cache_key] = {
-                                "result": result,
-                                "cached_at": datetime.now()
-                            }
-                            
-                            # Clean old cache entries
-                            self._clean_cache()
-                            
-                            return result
-                            
-                        except json.JSONDecodeError:
-                            # If not JSON, treat as text response
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/search",
+                json=payload,
+                headers=headers,
+                timeout=30
+            ) as response:
+                # Get response text first to handle both JSON and text responses
+                response_text = await response.text()
+                
+                if response.status == 200:
+                    try:
+                        # Try to parse as JSON
+                        data = json.loads(response_text)
+                        
+                        # Validate that data is a dictionary
+                        if not isinstance(data, dict):
                             self.error_count += 1
                             raise APIError(
-                                message=f"Tavily API returned non-JSON response: {response_text[:200]}",
+                                message=f"Tavily API returned non-dict response: {type(data)}",
                                 component="TavilySearchTool",
                                 operation="execute",
                                 context={
                                     "query": query,
                                     "status_code": response.status,
-                                    "response": response_text[:500]
+                                    "response_type": str(type(data)),
+                                    "response_preview": str(data)[:200]
                                 },
-                                suggested_action="Check Tavily API status or contact support",
+                                suggested_action="Check Tavily API documentation or contact support",
                                 retryable=True
                             )
-                    
-                    elif response.status == 429:
-                        # Rate limit exceeded
-                        self.error_count += 1
-                        raise RateLimitError(
-                            message="Tavily API rate limit exceeded",
-                            component="TavilySearchTool",
-                            operation="execute",
-                            context={
-                                "query": query,
-                                "status_code": response.status,
-                                "response": response_text[:500]
-                            },
-                            suggested_action="Wait before retrying or upgrade your Tavily plan",
-                            retryable=True
-                        )
-                    
-                    elif response.status == 401:
-                        # Authentication error
+                        
+                        # Calculate cost and duration
+                        duration = (datetime.now() - start_time).total_seconds() * 1000
+                        self.total_duration += duration
+                        self.total_cost += self.metadata.cost_per_call
+                        
+                        # Format results
+                        result = self._format_results(data, query)
+                        
+                        # Cache the result
+                        self.cache[cache_key] = {
+                            "result": result,
+                            "cached_at": datetime.now()
+                        }
+                        
+                        # Clean old cache entries
+                        self._clean_cache()
+                        
+                        return result
+                        
+                    except json.JSONDecodeError:
+                        # If not JSON, treat as text response
                         self.error_count += 1
                         raise APIError(
-                            message=f"Tavily API authentication failed: {response_text}",
+                            message=f"Tavily API returned non-JSON response: {response_text[:200]}",
                             component="TavilySearchTool",
                             operation="execute",
                             context={
@@ -188,25 +184,57 @@ class TavilySearchTool(BaseTool):
                                 "status_code": response.status,
                                 "response": response_text[:500]
                             },
-                            suggested_action="Check your TAVILY_API_KEY environment variable",
-                            retryable=False
-                        )
-                    
-                    else:
-                        # Other API error
-                        self.error_count += 1
-                        raise APIError(
-                            message=f"Tavily API error: {response.status} - {response_text}",
-                            component="TavilySearchTool",
-                            operation="execute",
-                            context={
-                                "query": query,
-                                "status_code": response.status,
-                                "error": response_text[:500]
-                            },
+                            suggested_action="Check Tavily API status or contact support",
                             retryable=True
                         )
-        
+                
+                elif response.status == 429:
+                    # Rate limit exceeded
+                    self.error_count += 1
+                    raise RateLimitError(
+                        message="Tavily API rate limit exceeded",
+                        component="TavilySearchTool",
+                        operation="execute",
+                        context={
+                            "query": query,
+                            "status_code": response.status,
+                            "response": response_text[:500]
+                        },
+                        suggested_action="Wait before retrying or upgrade your Tavily plan",
+                        retryable=True
+                    )
+                
+                elif response.status == 401:
+                    # Authentication error
+                    self.error_count += 1
+                    raise APIError(
+                        message=f"Tavily API authentication failed: {response_text}",
+                        component="TavilySearchTool",
+                        operation="execute",
+                        context={
+                            "query": query,
+                            "status_code": response.status,
+                            "response": response_text[:500]
+                        },
+                        suggested_action="Check your TAVILY_API_KEY environment variable",
+                        retryable=False
+                    )
+                
+                else:
+                    # Other API error
+                    self.error_count += 1
+                    raise APIError(
+                        message=f"Tavily API error: {response.status} - {response_text}",
+                        component="TavilySearchTool",
+                        operation="execute",
+                        context={
+                            "query": query,
+                            "status_code": response.status,
+                            "error": response_text[:500]
+                        },
+                        retryable=True
+                    )
+    
         except asyncio.TimeoutError:
             self.error_count += 1
             raise TimeoutError(
@@ -38,6 +38,10 @@ class BaseTool(ABC):
         """Execute the tool with given parameters"""
         pass
     
+    async def close(self):
+        """Release resources held by the tool, such as HTTP sessions"""
+        pass
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get tool usage statistics"""
         success_rate = 1 - (self.error_count / max(self.call_count, 1))
@@ -83,6 +87,11 @@ class ToolRegistry:
         tool_names = self.categories.get(category, [])
         return [self.tools[name] for name in tool_names]
     
+    async def close_all(self):
+        """Release resources held by every registered tool"""
+        for tool in self.tools.values():
+            await tool.close()
+    
     def get_all_stats(self) -> Dict[str, Any]:
         """Get statistics for all tools"""
         stats = {}
@@ -2,7 +2,7 @@ import yaml
 import os
 from pathlib import Path
 from typing import Dict, Any, List
-from app.models.agent_types import AgentConfig, AgentConfigManager
+from app.models.agent_types import AgentConfig, AgentConfigManager, REQUEST_TIMEOUT, MAX_RETRIES
 from app.models.schemas import RouterResponse
 from app.tools.tool_registry import ToolRegistry
 from app.tools.tavily_search import create_tavily_search_tool
@@ -165,9 +165,12 @@ class ConfigurationLoader:
                 headers=agent_def.get('headers', None),
                 system_prompt=system_prompt,
                 managed_agents=agent_def.get('managed_agents', None),
-                depends_on=agent_def.get('depends_on', None),
+                depends_on=agent_def.get('depends_on') or [],
                 output_schema=agent_def.get('output_schema', None),
                 require_approval=agent_def.get('require_approval', False),
+                cache_responses=agent_def.get('cache_responses', False),
+                request_timeout=resolve_val('request_timeout', REQUEST_TIMEOUT),
+                max_retries=resolve_val('max_retries', MAX_RETRIES),
                 tool_names=agent_def.get('tools', None)
             )
             
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+In-process cache for agent LLM responses.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+class LLMResponseCache:
+    """Bounded LRU cache of LLM responses keyed on (agent, system prompt, task)"""
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Collapse case and whitespace so trivially different tasks share an entry"""
+        return " ".join(text.lower().split())
+
+    def _key(self, agent_name: str, system_prompt: str, user_content: str) -> Tuple[str, str, str]:
+        """Build cache key"""
+        prompt_hash = hashlib.sha1(system_prompt.encode("utf-8")).hexdigest()
+        return (agent_name, prompt_hash, self._normalize(user_content))
+
+    def get(self, agent_name: str, system_prompt: str, user_content: str) -> Optional[str]:
+        """Return cached response or None"""
+        key = self._key(agent_name, system_prompt, user_content)
+        response = self._entries.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return response
+
+    def set(self, agent_name: str, system_prompt: str, user_content: str, response: str):
+        """Store response, evicting the least recently used entry when full"""
+        if self.max_size <= 0:
+            return
+
+        key = self._key(agent_name, system_prompt, user_content)
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(self, agent_name: str, system_prompt: str, user_content: str,
+                             compute: Callable[[], Awaitable[str]]) -> str:
+        """Return cached response or compute it, coalescing concurrent identical requests"""
+        if self.max_size <= 0:
+            return await compute()
+        
+        cached = self.get(agent_name, system_prompt, user_content)
+        if cached is not None:
+            return cached
+        
+        # Share an identical in-flight call's result instead of issuing a duplicate one.
+        # A None result means that call failed, so the next waiter takes over.
+        key = self._key(agent_name, system_prompt, user_content)
+        while (pending := self._in_flight.get(key)) is not None:
+            response = await asyncio.shield(pending)
+            if response is not None:
+                return response
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        response = None
+        try:
+            response = await compute()
+            self.set(agent_name, system_prompt, user_content, response)
+            return response
+        finally:
+            del self._in_flight[key]
+            future.set_result(response)
+
+    def clear(self):
+        """Drop all cached responses"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0
+        }
@@ -3,9 +3,19 @@
 Utilities for message processing in hierarchical agent systems.
 """
 
+import re
 from typing import List, Dict, Any, Optional
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 
+# Keywords marking a task that needs the repository URL kept, matched in one pass
+_PROMOTE_KEYWORDS_RE = re.compile(r'promote|share|post about|announce|launch', re.IGNORECASE)
+
+# URL preface phrases stripped from tasks that don't need the URL
+_URL_PHRASES_RE = re.compile(
+    r'here is the repo url:|here is the repository:|repository url:|github url:|url:|link:',
+    re.IGNORECASE
+)
+
 
 def extract_original_task(
     messages: List[BaseMessage],
@@ -121,6 +131,49 @@ def create_agent_response(
         return [message]
 
 
+def build_cached_prompt(system_prompt: str, user_content: str) -> List[Dict[str, str]]:
+    """
+    Build chat messages with the static system prompt as a separate leading message.
+    
+    Providers with automatic prompt caching (OpenAI, DeepSeek) only reuse cached
+    input tokens for an identical prefix, so the per-call content goes last.
+    
+    Args:
+        system_prompt: The agent's static system prompt
+        user_content: The per-call task content
+        
+    Returns:
+        List of role/content message dicts
+    """
+    if not system_prompt:
+        return [{"role": "user", "content": user_content}]
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content}
+    ]
+
+
+def truncate_for_prompt(text: str, max_tokens: int = 4000, chars_per_token: int = 4) -> str:
+    """
+    Cap text pasted into a prompt to roughly max_tokens tokens.
+    
+    Uses a characters-per-token estimate so no tokenizer is needed; long
+    upstream agent outputs would otherwise be re-billed on every hop.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Approximate token budget
+        chars_per_token: Average characters per token for the estimate
+        
+    Returns:
+        The original text, or its head followed by a truncation marker
+    """
+    max_chars = max_tokens * chars_per_token
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + f"\n\n[... truncated {len(text) - max_chars} characters]"
+
+
 def sanitize_messages_for_agent(
     messages: List[BaseMessage],
     max_history: int = 3
@@ -232,8 +285,17 @@ def detect_message_nesting(messages: List[BaseMessage], threshold: float = 3.0)
     Returns:
         True if nesting is detected, False otherwise
     """
-    metrics = calculate_message_complexity(messages)
-    return metrics["nesting_ratio"] > threshold
+    # Count message types directly; the full complexity metrics also measure
+    # every message's content, which the ratio doesn't need
+    human_count = 0
+    ai_count = 0
+    for message in messages:
+        if isinstance(message, HumanMessage):
+            human_count += 1
+        elif isinstance(message, AIMessage):
+            ai_count += 1
+    
+    return ai_count / max(human_count, 1) > threshold
 
 
 def reset_message_nesting(
@@ -279,8 +341,6 @@ def extract_github_repo_info(task_text: str) -> Dict[str, Any]:
     Returns:
         Dictionary with repository information
     """
-    import re
-    
     # Pattern to match GitHub URLs
     github_pattern = r'https?://github\.com/([a-zA-Z0-9_.-]+)/([a-zA-Z0-9_.-]+)'
     
@@ -319,8 +379,6 @@ def clean_task_text(task_text: str) -> str:
     Returns:
         Cleaned task text
     """
-    import re
-    
     # Extract GitHub repo info
     repo_info = extract_github_repo_info(task_text)
     
@@ -331,8 +389,7 @@ def clean_task_text(task_text: str) -> str:
         
         # Check if the task explicitly mentions promoting or sharing the repo
         # If so, keep the URL as it's essential information
-        promote_keywords = ['promote', 'share', 'post about', 'announce', 'launch']
-        has_promote_keyword = any(keyword in task_text.lower() for keyword in promote_keywords)
+        has_promote_keyword = _PROMOTE_KEYWORDS_RE.search(task_text) is not None
         
         if has_promote_keyword:
             # For promotion tasks, keep the URL in the text
@@ -345,17 +402,7 @@ def clean_task_text(task_text: str) -> str:
             cleaned = re.sub(url_pattern, '', task_text)
             
             # Also remove common URL preface phrases
-            url_phrases = [
-                r'here is the repo url:',
-                r'here is the repository:',
-                r'repository url:',
-                r'github url:',
-                r'url:',
-                r'link:'
-            ]
-            
-            for phrase in url_phrases:
-                cleaned = re.sub(phrase, '', cleaned, flags=re.IGNORECASE)
+            cleaned = _URL_PHRASES_RE.sub('', cleaned)
             
             # Clean up extra spaces and punctuation
             cleaned = re.sub(r'\s+', ' ', cleaned).strip()
@@ -7,6 +7,7 @@ dynamic, configuration-driven graph builder with real-time monitoring.
 
 import asyncio
 import sys
+import time
 import argparse
 import yaml
 from datetime import datetime
@@ -25,6 +26,9 @@ from rich import box
 
 console = Console()
 
+# Message names that are not agent output
+_NON_AGENT_NAMES = frozenset({"user", "system"})
+
 
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.types import Command
@@ -172,7 +176,9 @@ async def run_task(task_description: str, config_path: str = "config/agents.yaml
         "messages": [HumanMessage(content=task_description)],
         "iteration_count": 0,
         "workflow_status": "running",
-        "start_time": datetime.now(),
+        "start_time_ns": time.perf_counter_ns(),
+        # Wall-clock, so the budget still holds if the thread is resumed in another process
+        "deadline": time.time() + builder.workflow_timeout if builder.workflow_timeout else None,
         "original_task": task_description,
         "current_task": task_description
     }
@@ -195,7 +201,8 @@ async def run_task(task_description: str, config_path: str = "config/agents.yaml
             # If we reach here without exception, check if finished
             snapshot = workflow.get_state(thread_config)
             if not snapshot.next:
-                console.print(Panel("Task Completed Successfully", style="bold green"))
+                elapsed = (time.perf_counter_ns() - initial_input["start_time_ns"]) / 1e9
+                console.print(Panel(f"Task Completed Successfully in {elapsed:.1f}s", style="bold green"))
                 break
             else:
                 # If there are next steps but stream finished, we might be interrupted? 
@@ -240,6 +247,7 @@ async def run_task(task_description: str, config_path: str = "config/agents.yaml
             break
             
     # Final cleanup
+    await builder.aclose()
     # stream.unsubscribe(sub) # if subscribe returns anything, standard doesn't return handle usually or depends on impl
     
     # Display final results
@@ -247,7 +255,7 @@ async def run_task(task_description: str, config_path: str = "config/agents.yaml
     messages = snapshot.values.get("messages", [])
     if messages:
         for msg in messages:
-            if isinstance(msg, AIMessage) or (hasattr(msg, 'name') and msg.name not in ['user', 'system']):
+            if isinstance(msg, AIMessage) or getattr(msg, 'name', None) not in _NON_AGENT_NAMES:
                 name = getattr(msg, 'name', 'Assistant')
                 console.print(Panel(msg.content, title=f"📄 Final Output: {name}", border_style="blue"))
 
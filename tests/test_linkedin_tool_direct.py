@@ -239,11 +239,9 @@ async def main():
     """Run all tests"""
     print("🔧 Testing tool integration...")
 
-    # Test web_researcher with tavily_search
-    await test_web_researcher_tool()
-
-    # Test linkedin_manager with linkedin_post
-    await test_linkedin_tool()
+    # web_researcher (tavily_search) and linkedin_manager (linkedin_post) are
+    # independent, so run them concurrently on the same event loop
+    await asyncio.gather(test_web_researcher_tool(), test_linkedin_tool())
 
     # Test interactive approval
     await test_linkedin_interactive_approval()
@@ -253,4 +251,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    with asyncio.Runner() as runner:
+        runner.run(main())
\ No newline at end of file